@@ -6,8 +6,12 @@ from pathlib import Path
 fixtures_dir = Path(__file__).parent / "tests" / "fixtures"
 
 # Load SPY data
-spy_data = pd.read_csv(fixtures_dir / "spy_2010_2020.csv")
-agg_data = pd.read_csv(fixtures_dir / "agg_2010_2020.csv")
+csv_options = {
+    "parse_dates": ["date"],
+    "dtype": {"symbol": "category", "price": "float64", "currency": "category"},
+}
+spy_data = pd.read_csv(fixtures_dir / "spy_2010_2020.csv", **csv_options)
+agg_data = pd.read_csv(fixtures_dir / "agg_2010_2020.csv", **csv_options)
 
 print("=" * 60)
 print("Test Fixture Data Diagnosis")
@@ -16,19 +20,23 @@ print()
 
 print("SPY Data:")
 print(f"  Total records: {len(spy_data)}")
-print(f"  Date range: {spy_data['date'].min()} to {spy_data['date'].max()}")
+print(
+    f"  Date range: {spy_data['date'].min().date()} to {spy_data['date'].max().date()}"
+)
 print(f"  Unique dates: {spy_data['date'].nunique()}")
 print()
 
 print("AGG Data:")
 print(f"  Total records: {len(agg_data)}")
-print(f"  Date range: {agg_data['date'].min()} to {agg_data['date'].max()}")
+print(
+    f"  Date range: {agg_data['date'].min().date()} to {agg_data['date'].max().date()}"
+)
 print(f"  Unique dates: {agg_data['date'].nunique()}")
 print()
 
 print("SPY Dates:")
-for i, row in spy_data.iterrows():
-    print(f"  {row['date']}: ${row['price']}")
+for day, price in zip(spy_data["date"].dt.date, spy_data["price"]):
+    print(f"  {day}: ${price}")
 print()
 
 print("=" * 60)
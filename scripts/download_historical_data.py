@@ -1,38 +1,125 @@
 """Download full historical data from Yahoo Finance."""
 
+import hashlib
+import time
+
 import yfinance as yf
 import pandas as pd
 from pathlib import Path
 
+# On-disk cache for raw yfinance downloads
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "yfinance"
+CACHE_TTL_SECONDS = 24 * 60 * 60
 
-def download_ticker_data(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
-    """Download historical data for a ticker from Yahoo Finance.
+# Date format used in the CSV fixtures
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _cache_path(symbols: list[str], start_date: str, end_date: str) -> Path:
+    """Return the cache file path for a download request.
 
     Args:
-        symbol: Ticker symbol (e.g., 'SPY', 'AGG')
+        symbols: Ticker symbols in the request
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
 
+    Returns:
+        Path of the pickled download for this request
+    """
+    key = f"{','.join(symbols)}|{start_date}|{end_date}"
+    digest = hashlib.md5(key.encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def _load_cached(path: Path) -> pd.DataFrame | None:
+    """Load a cached download if it exists and is younger than the TTL."""
+    if not path.exists():
+        return None
+    if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+        return None
+    return pd.read_pickle(path)
+
+
+def _to_price_frame(symbol: str, hist: pd.DataFrame) -> pd.DataFrame:
+    """Convert a yfinance OHLC frame into the fixture price format.
+
+    Args:
+        symbol: Ticker symbol the frame belongs to
+        hist: yfinance history indexed by date with a Close column
+
     Returns:
         DataFrame with date, symbol, and price columns
     """
-    print(f"Downloading {symbol} data from {start_date} to {end_date}...")
+    # Batched downloads align all tickers on one index; drop dates before
+    # this ticker started trading
+    close = hist["Close"].dropna()
 
-    ticker = yf.Ticker(symbol)
-    hist = ticker.history(start=start_date, end=end_date)
+    # Keep dates as datetime64; they are only formatted when written to CSV
+    dates = close.index.tz_localize(None) if close.index.tz else close.index
 
     # Use adjusted close price
-    df = pd.DataFrame(
+    return pd.DataFrame(
         {
-            "date": hist.index.strftime("%Y-%m-%d"),
+            "date": dates,
             "symbol": symbol,
-            "price": hist["Close"].round(2),
+            "price": close.round(2).to_numpy(),
             "currency": "USD",
         }
     )
 
-    print(f"✓ Downloaded {len(df)} records for {symbol}")
-    return df
+
+def download_prices(
+    symbols: list[str], start_date: str, end_date: str
+) -> dict[str, pd.DataFrame]:
+    """Download historical data for several tickers in one batched request.
+
+    Args:
+        symbols: Ticker symbols (e.g., ['SPY', 'AGG'])
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        Dictionary mapping symbol to DataFrame with date, symbol, and price columns
+    """
+    print(f"Downloading {', '.join(symbols)} data from {start_date} to {end_date}...")
+
+    cache_path = _cache_path(symbols, start_date, end_date)
+    data = _load_cached(cache_path)
+
+    if data is None:
+        data = yf.download(
+            symbols,
+            start=start_date,
+            end=end_date,
+            auto_adjust=True,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_pickle(cache_path)
+    else:
+        print(f"✓ Using cached download from {cache_path}")
+
+    frames = {}
+    for symbol in symbols:
+        frames[symbol] = _to_price_frame(symbol, data[symbol])
+        print(f"✓ Downloaded {len(frames[symbol])} records for {symbol}")
+    return frames
+
+
+def download_ticker_data(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Download historical data for a ticker from Yahoo Finance.
+
+    Args:
+        symbol: Ticker symbol (e.g., 'SPY', 'AGG')
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+
+    Returns:
+        DataFrame with date, symbol, and price columns
+    """
+    return download_prices([symbol], start_date, end_date)[symbol]
 
 
 def main():
@@ -46,17 +133,21 @@ def main():
     end_date = "2025-11-23"
     fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures"
 
-    # Download SPY data
-    spy_data = download_ticker_data("SPY", start_date, end_date)
+    # Download SPY and AGG data in a single batched request
+    prices = download_prices(["SPY", "AGG"], start_date, end_date)
+    print()
+
+    # Save SPY data
+    spy_data = prices["SPY"]
     spy_file = fixtures_dir / "spy_2010_2020.csv"
-    spy_data.to_csv(spy_file, index=False)
+    spy_data.to_csv(spy_file, index=False, date_format=DATE_FORMAT)
     print(f"✓ Saved to {spy_file}")
     print()
 
-    # Download AGG data
-    agg_data = download_ticker_data("AGG", start_date, end_date)
+    # Save AGG data
+    agg_data = prices["AGG"]
     agg_file = fixtures_dir / "agg_2010_2020.csv"
-    agg_data.to_csv(agg_file, index=False)
+    agg_data.to_csv(agg_file, index=False, date_format=DATE_FORMAT)
     print(f"✓ Saved to {agg_file}")
     print()
 
@@ -64,10 +155,16 @@ def main():
     print("Summary")
     print("=" * 60)
     print(f"SPY: {len(spy_data)} trading days")
-    print(f"  Date range: {spy_data['date'].min()} to {spy_data['date'].max()}")
+    print(
+        f"  Date range: {spy_data['date'].min().date()} "
+        f"to {spy_data['date'].max().date()}"
+    )
     print()
     print(f"AGG: {len(agg_data)} trading days")
-    print(f"  Date range: {agg_data['date'].min()} to {agg_data['date'].max()}")
+    print(
+        f"  Date range: {agg_data['date'].min().date()} "
+        f"to {agg_data['date'].max().date()}"
+    )
     print()
     print("✓ Historical data download complete!")
 
@@ -1,6 +1,7 @@
 """Generate expected results from actual backtest runs."""
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import date
 from decimal import Decimal
@@ -8,21 +9,15 @@ from decimal import Decimal
 from src.backtesting.engine import BacktestEngine
 from src.models.backtest_config import BacktestConfiguration, TransactionCosts
 from src.models.strategy import AllocationStrategy
+from src.models.performance import PerformanceMetrics
 from src.models import RebalancingFrequency
 from src.data.loaders import CSVDataProvider
 
 
-def main():
-    fixtures_dir = Path(__file__).parent / "tests" / "fixtures"
+def _run_spy(fixtures_dir: Path) -> PerformanceMetrics:
+    """Run the SPY buy-and-hold 2010-2020 backtest."""
     data_provider = CSVDataProvider(fixtures_dir)
 
-    print("Running backtests to generate expected results...")
-    print("=" * 60)
-
-    # Test 1: SPY buy-and-hold 2010-2020
-    print("\n1. SPY Buy-and-Hold (2010-2020)")
-    print("-" * 60)
-
     spy_prices = data_provider.load_prices(
         symbols=["SPY"], start_date=date(2010, 1, 4), end_date=date(2020, 12, 31)
     )
@@ -40,18 +35,12 @@ def main():
         transaction_costs=TransactionCosts(Decimal("0"), Decimal("0")),
     )
 
-    engine = BacktestEngine()
-    spy_result = engine.run_backtest(spy_config, spy_strategy, spy_prices)
+    return BacktestEngine().run_backtest(spy_config, spy_strategy, spy_prices).metrics
 
-    print(f"Total Return: {spy_result.metrics.total_return}")
-    print(f"Annualized Return: {spy_result.metrics.annualized_return}")
-    print(f"Volatility: {spy_result.metrics.volatility}")
-    print(f"Max Drawdown: {spy_result.metrics.max_drawdown}")
-    print(f"Sharpe Ratio: {spy_result.metrics.sharpe_ratio}")
 
-    # Test 2: 60/40 portfolio with quarterly rebalancing
-    print("\n2. 60/40 Portfolio with Quarterly Rebalancing (2010-2020)")
-    print("-" * 60)
+def _run_6040(fixtures_dir: Path) -> PerformanceMetrics:
+    """Run the 60/40 quarterly-rebalanced 2010-2020 backtest."""
+    data_provider = CSVDataProvider(fixtures_dir)
 
     prices = data_provider.load_prices(
         symbols=["SPY", "AGG"], start_date=date(2010, 1, 4), end_date=date(2020, 12, 31)
@@ -72,27 +61,53 @@ def main():
         risk_free_rate=Decimal("0.02"),
     )
 
-    result = engine.run_backtest(config, strategy, prices)
+    return BacktestEngine().run_backtest(config, strategy, prices).metrics
+
 
-    print(f"Total Return: {result.metrics.total_return}")
-    print(f"Annualized Return: {result.metrics.annualized_return}")
-    print(f"Volatility: {result.metrics.volatility}")
-    print(f"Max Drawdown: {result.metrics.max_drawdown}")
-    print(f"Sharpe Ratio: {result.metrics.sharpe_ratio}")
-    print(f"Number of Trades: {result.metrics.num_trades}")
+def main():
+    fixtures_dir = Path(__file__).parent / "tests" / "fixtures"
+
+    print("Running backtests to generate expected results...")
+    print("=" * 60)
+
+    # The two backtests are independent; run them in separate processes
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        spy_future = executor.submit(_run_spy, fixtures_dir)
+        portfolio_future = executor.submit(_run_6040, fixtures_dir)
+        spy_metrics = spy_future.result()
+        metrics = portfolio_future.result()
+
+    # Test 1: SPY buy-and-hold 2010-2020
+    print("\n1. SPY Buy-and-Hold (2010-2020)")
+    print("-" * 60)
+    print(f"Total Return: {spy_metrics.total_return}")
+    print(f"Annualized Return: {spy_metrics.annualized_return}")
+    print(f"Volatility: {spy_metrics.volatility}")
+    print(f"Max Drawdown: {spy_metrics.max_drawdown}")
+    print(f"Sharpe Ratio: {spy_metrics.sharpe_ratio}")
+
+    # Test 2: 60/40 portfolio with quarterly rebalancing
+    print("\n2. 60/40 Portfolio with Quarterly Rebalancing (2010-2020)")
+    print("-" * 60)
+    print(f"Total Return: {metrics.total_return}")
+    print(f"Annualized Return: {metrics.annualized_return}")
+    print(f"Volatility: {metrics.volatility}")
+    print(f"Max Drawdown: {metrics.max_drawdown}")
+    print(f"Sharpe Ratio: {metrics.sharpe_ratio}")
+    print(f"Number of Trades: {metrics.num_trades}")
 
     # Generate expected results JSON
     expected_results = {
         "spy_buy_and_hold_2010_2020": {
             "description": "100% SPY buy-and-hold from 2010-01-04 to 2020-12-31",
-            "total_return": float(spy_result.metrics.total_return),
-            "max_drawdown": float(spy_result.metrics.max_drawdown),
+            "total_return": float(spy_metrics.total_return),
+            "max_drawdown": float(spy_metrics.max_drawdown),
             "tolerance": 0.02,
         },
         "60_40_portfolio": {
             "description": "60% SPY / 40% AGG with quarterly rebalancing",
-            "annualized_return": float(result.metrics.annualized_return),
-            "sharpe_ratio": float(result.metrics.sharpe_ratio),
+            "annualized_return": float(metrics.annualized_return),
+            "sharpe_ratio": float(metrics.sharpe_ratio),
             "tolerance_return": 0.02,
             "tolerance_sharpe": 0.2,
         },
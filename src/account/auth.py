@@ -1,17 +1,32 @@
 """Authentication logic for brokerage accounts."""
 
+import hashlib
+import threading
 from datetime import datetime, timezone
+from typing import Optional
 from src.account.models import BrokerageAccount
 from src.account.config import AccountCredentials
 from src.account.exceptions import AccountAuthException
 
+# Provider instances keyed by (provider name, SHA-256 of app key) so the
+# plaintext key is not held in the cache; the lock makes
+# concurrent first lookups share one instance instead of racing
+_providers: dict = {}
+_providers_lock = threading.Lock()
 
-def get_provider(provider_name: str):
+
+def get_provider(provider_name: str, app_key: Optional[str] = None):
     """
     Get provider implementation by name.
 
+    One instance is created and reused per (provider, app key) pair. The
+    brokerage applies rate limits per app key, so accounts with different
+    keys get their own rate limiter and HTTP session and can be fetched
+    concurrently, while accounts sharing a key share the limiter.
+
     Args:
         provider_name: Provider identifier (e.g., "korea_investment")
+        app_key: API app key the provider instance will be used with
 
     Returns:
         AccountProvider: Provider instance
@@ -19,12 +34,21 @@ def get_provider(provider_name: str):
     Raises:
         ValueError: If provider is not supported
     """
-    if provider_name == "korea_investment":
-        from src.account.providers.korea_investment import KoreaInvestmentProvider
-
-        return KoreaInvestmentProvider()
-    else:
-        raise ValueError(f"Unsupported provider: {provider_name}")
+    key_digest = hashlib.sha256(app_key.encode()).hexdigest() if app_key else None
+    key = (provider_name, key_digest)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            if provider_name == "korea_investment":
+                from src.account.providers.korea_investment import (
+                    KoreaInvestmentProvider,
+                )
+
+                provider = KoreaInvestmentProvider()
+            else:
+                raise ValueError(f"Unsupported provider: {provider_name}")
+            _providers[key] = provider
+    return provider
 
 
 def authenticate(
@@ -43,7 +67,7 @@ def authenticate(
     Raises:
         AccountAuthException: If authentication fails
     """
-    provider = get_provider(account.provider)
+    provider = get_provider(account.provider, credentials.app_key)
 
     try:
         authenticated_account = provider.authenticate(account, credentials)
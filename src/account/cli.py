@@ -1,12 +1,13 @@
 """Command-line interface for account operations."""
 
 import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from pathlib import Path
 
-from src.account.service import AccountService
-from src.account.exceptions import AccountException
-
 # Slack notification messages
 MSG_SLACK_NOT_CONFIGURED = "\n⚠️  Slack notifications not configured in config.yaml"
 MSG_SLACK_DISABLED = "\n⚠️  Slack notifications are disabled in config.yaml"
@@ -15,6 +16,16 @@ MSG_SENDING = "\n📤 Sending to Slack..."
 MSG_ALL_SUCCESS = "\n✅ All {} notifications sent successfully!"
 MSG_PARTIAL_SUCCESS = "\n⚠️  Sent {}/{} notifications"
 
+# Report section separator
+SEP = "=" * 60
+
+# Upper bound on concurrent Slack webhook posts
+MAX_SLACK_WORKERS = 8
+
+# AccountService reused across invocations in the same process, keyed by
+# (config path, mtime_ns, size, encryption key hash)
+_SERVICE_CACHE: dict = {}
+
 
 def validate_slack_config(config):
     """
@@ -63,27 +74,36 @@ def send_to_slack(config, holdings_list):
         print(error_message)
         return -1
 
-    # Send each holding
+    # Send holdings concurrently, reporting results in input order
     print(MSG_SENDING)
     success_count = 0
     failed_accounts = []
 
-    for holdings in holdings_list:
-        try:
-            if send_portfolio_update(
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_SLACK_WORKERS, len(holdings_list)))
+    ) as executor:
+        futures = [
+            executor.submit(
+                send_portfolio_update,
                 holdings,
                 webhook_url,
                 format_type=format_type,
                 trigger_type="manual_refresh",
-            ):
-                success_count += 1
-                print(f"  ✅ Sent: {holdings.account_id}")
-            else:
+            )
+            for holdings in holdings_list
+        ]
+
+        for holdings, future in zip(holdings_list, futures):
+            try:
+                if future.result():
+                    success_count += 1
+                    print(f"  ✅ Sent: {holdings.account_id}")
+                else:
+                    failed_accounts.append(holdings.account_id)
+                    print(f"  ❌ Failed: {holdings.account_id}")
+            except Exception as e:
                 failed_accounts.append(holdings.account_id)
-                print(f"  ❌ Failed: {holdings.account_id}")
-        except Exception as e:
-            failed_accounts.append(holdings.account_id)
-            print(f"  ❌ Failed: {holdings.account_id} - {str(e)}")
+                print(f"  ❌ Failed: {holdings.account_id} - {str(e)}")
 
     if success_count == len(holdings_list):
         print(MSG_ALL_SUCCESS.format(success_count))
@@ -99,46 +119,83 @@ def display_holdings(holdings, show_details=True):
     """
     Display holdings in formatted output.
 
+    Lines are collected and written to stdout in a single call.
+
     Args:
         holdings: AccountHoldings to display
         show_details: Whether to show detailed position info
     """
-    print(f"\n{'='*60}")
-    print(f"Account: {holdings.account_id}")
-    print(f"Timestamp: {holdings.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*60}")
+    lines = [
+        f"\n{SEP}",
+        f"Account: {holdings.account_id}",
+        f"Timestamp: {holdings.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+        SEP,
+    ]
 
-    # Show currency breakdown if available
-    if holdings.krw_cash_balance is not None and holdings.usd_cash_balance is not None:
-        from decimal import Decimal
+    from src.notifications.formatters import format_krw, format_usd
 
-        print(f"Cash Balance (KRW): ₩{int(holdings.krw_cash_balance):,}")
-        if holdings.usd_cash_balance > 0:
-            usd_in_krw = holdings.usd_cash_balance * (
-                holdings.exchange_rate or Decimal("0")
-            )
-            print(
-                f"Cash Balance (USD): ${float(holdings.usd_cash_balance):,.2f} (₩{int(usd_in_krw):,} @ ₩{float(holdings.exchange_rate):,.2f})"
+    # Show currency breakdown if available
+    krw_cash = holdings.krw_cash_balance
+    usd_cash = holdings.usd_cash_balance
+    if krw_cash is not None and usd_cash is not None:
+        lines.append(f"Cash Balance (KRW): {format_krw(krw_cash)}")
+        if usd_cash > 0:
+            rate = holdings.exchange_rate or Decimal("0")
+            lines.append(
+                f"Cash Balance (USD): {format_usd(usd_cash)} "
+                f"({format_krw(usd_cash * rate)} @ ₩{rate:,.2f})"
             )
-        print(f"Total Cash:         ₩{int(holdings.cash_balance):,}")
+        lines.append(f"Total Cash:         {format_krw(holdings.cash_balance)}")
     else:
-        print(f"Cash Balance:       ₩{int(holdings.cash_balance):,}")
+        lines.append(f"Cash Balance:       {format_krw(holdings.cash_balance)}")
 
-    print(f"Total Value:        ₩{int(holdings.total_value):,}")
-    print(f"Holdings:           {len(holdings.positions)} securities")
-    print(f"{'='*60}")
+    lines.append(f"Total Value:        {format_krw(holdings.total_value)}")
+    lines.append(f"Holdings:           {len(holdings.positions)} securities")
+    lines.append(SEP)
 
     if show_details and holdings.positions:
-        print("\nHoldings Details:")
+        lines.append("\nHoldings Details:")
         for pos in holdings.positions:
             warning = " ⚠️" if pos.has_warning else ""
-            print(f"\n  • {pos.name} ({pos.symbol}){warning}")
-            print(f"    Quantity: {pos.quantity} shares")
-            print(f"    Current Price: ₩{pos.current_price:,}")
-            print(f"    Value: ₩{pos.current_value:,}")
+            lines.append(f"\n  • {pos.name} ({pos.symbol}){warning}")
+            lines.append(f"    Quantity: {pos.quantity} shares")
+            lines.append(f"    Current Price: ₩{pos.current_price:,}")
+            lines.append(f"    Value: ₩{pos.current_value:,}")
             if pos.profit_loss:
                 pl_sign = "+" if pos.profit_loss > 0 else ""
-                print(f"    P/L: {pl_sign}₩{pos.profit_loss:,}")
+                lines.append(f"    P/L: {pl_sign}₩{pos.profit_loss:,}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _get_service(config_path):
+    """
+    Return an AccountService for config_path, reusing it while unchanged.
+
+    Long-running callers that invoke commands repeatedly keep their
+    authenticated providers and HTTP sessions. The cached service is
+    replaced when the config file's modification time or size changes, or
+    when ACCOUNT_ENCRYPTION_KEY changes.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        AccountService: Service bound to the configuration
+    """
+    from src.account.service import AccountService
+
+    stat = Path(config_path).stat()
+    # Hash the key so the plaintext secret is not held in the cache
+    encryption_key = os.environ.get("ACCOUNT_ENCRYPTION_KEY", "")
+    key_digest = hashlib.sha256(encryption_key.encode()).hexdigest()
+    key = (config_path, stat.st_mtime_ns, stat.st_size, key_digest)
+    service = _SERVICE_CACHE.get(key)
+    if service is None:
+        service = AccountService(config_path)
+        _SERVICE_CACHE.clear()
+        _SERVICE_CACHE[key] = service
+    return service
 
 
 def cmd_fetch(args):
@@ -149,8 +206,11 @@ def cmd_fetch(args):
         print(f"Error: Configuration file not found: {config_path}")
         return 1
 
+    # Deferred so that --help and status skip the service/provider imports
+    from src.account.exceptions import AccountException
+
     try:
-        service = AccountService(config_path)
+        service = _get_service(config_path)
 
         # Collect holdings to display/send
         holdings_list = []
@@ -209,9 +269,9 @@ def cmd_status(args):
 
         config = load_config(config_path)
 
-        print(f"\n{'='*60}")
+        print(f"\n{SEP}")
         print("Account Configuration Status")
-        print(f"{'='*60}")
+        print(SEP)
 
         for account in config.accounts:
             status = "✓ Enabled" if account.enabled else "✗ Disabled"
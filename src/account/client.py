@@ -1,13 +1,15 @@
 """Client utilities for API requests with retry logic."""
 
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
+import time
+from functools import wraps
+
 from src.account.exceptions import AccountAPIException
 
+# Retry policy: 3 total attempts, backoff of 1s then 2s (capped at 4s)
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 4.0
+
 
 def with_retry(func):
     """
@@ -22,9 +24,16 @@ def with_retry(func):
     Returns:
         Wrapped function with retry behavior
     """
-    return retry(
-        stop=stop_after_attempt(3),  # 3 total attempts
-        wait=wait_exponential(multiplier=1, min=1, max=4),  # 1s, 2s, 4s
-        retry=retry_if_exception_type(AccountAPIException),  # Only retry API errors
-        reraise=True,  # Re-raise the last exception if all retries fail
-    )(func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except AccountAPIException:  # Only retry API errors
+                if attempt == MAX_ATTEMPTS - 1:
+                    # Re-raise the last exception if all retries fail
+                    raise
+                time.sleep(min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+    return wrapper
@@ -1,12 +1,28 @@
 """Configuration management with pydantic validation."""
 
-from typing import List
+import json
+import os
+from collections import OrderedDict
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from src.account.crypto import decrypt, get_encryption_key_from_env
 
+# Parsed configs keyed by (resolved path, mtime_ns, size, encryption key)
+_CONFIG_CACHE: "OrderedDict[tuple, Config]" = OrderedDict()
+_CONFIG_CACHE_MAX = 16
+
+# Opt-in on-disk cache of the validated (still encrypted) config
+CONFIG_CACHE_ENV_VAR = "ACCOUNT_CONFIG_CACHE"
+
 
 class AccountCredentials(BaseModel):
     """Brokerage account credentials."""
@@ -84,6 +100,13 @@ def load_config(config_path: str) -> Config:
     """
     Load configuration from YAML file and decrypt credentials.
 
+    Parsed configurations are cached in-process and reused while the file's
+    modification time and size are unchanged. Each call returns an
+    independent copy. Setting ACCOUNT_CONFIG_CACHE=1 additionally keeps an
+    owner-only JSON sidecar of the validated config next to the file, for
+    configs whose credentials are all encrypted, so new processes can skip
+    YAML parsing.
+
     Args:
         config_path: Path to configuration file
 
@@ -98,20 +121,120 @@ def load_config(config_path: str) -> Config:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    # Load YAML
-    with open(config_file, "r") as f:
-        config_data = yaml.safe_load(f)
+    encryption_key = get_encryption_key_from_env()
+
+    stat = config_file.stat()
+    cache_key = (
+        str(config_file.resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+        encryption_key,
+    )
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(cache_key)
+        return cached.model_copy(deep=True)
 
-    # Parse with pydantic
-    config = Config(**config_data)
+    use_sidecar = os.environ.get(CONFIG_CACHE_ENV_VAR) == "1"
+    config = _read_sidecar(config_file, stat) if use_sidecar else None
 
-    # Decrypt credentials if they appear to be encrypted
-    encryption_key = get_encryption_key_from_env()
+    if config is None:
+        # Load YAML
+        with open(config_file, "rb") as f:
+            config_data = yaml.load(f, Loader=_SafeLoader)
+
+        # Parse with pydantic
+        config = Config.model_validate(config_data)
 
+        if use_sidecar:
+            _write_sidecar(config_file, stat, config)
+
+    # Decrypt credentials if they appear to be encrypted
     for account in config.accounts:
         account.credentials = decrypt_credentials(account.credentials, encryption_key)
 
-    return config
+    _CONFIG_CACHE[cache_key] = config
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return config.model_copy(deep=True)
+
+
+def _sidecar_path(config_file: Path) -> Path:
+    """Return the path of the JSON cache written next to a config file."""
+    return config_file.with_name(f".{config_file.name}.cache.json")
+
+
+def _read_sidecar(config_file: Path, stat: os.stat_result) -> Optional[Config]:
+    """
+    Load a validated config from its JSON sidecar if it is still current.
+
+    Args:
+        config_file: Path to the YAML configuration file
+        stat: Current stat result of the configuration file
+
+    Returns:
+        Config if the sidecar matches the file's mtime and size, else None
+    """
+    try:
+        with open(_sidecar_path(config_file), "rb") as f:
+            cached = json.load(f)
+        if cached["mtime_ns"] != stat.st_mtime_ns or cached["size"] != stat.st_size:
+            return None
+        return Config.model_validate(cached["config"])
+    except Exception:
+        # Missing, stale or corrupt sidecars fall back to parsing the YAML
+        return None
+
+
+def _write_sidecar(config_file: Path, stat: os.stat_result, config: Config) -> None:
+    """
+    Write a validated config to its JSON sidecar.
+
+    The sidecar is only written when every account's credentials are
+    Fernet-encrypted in the YAML, so plaintext credentials never get a second
+    copy on disk. It is created owner-only (0600) through a temporary file
+    and an atomic rename, like the token cache.
+
+    Args:
+        config_file: Path to the YAML configuration file
+        stat: Stat result the config was loaded from
+        config: Validated configuration, before credential decryption
+    """
+    all_encrypted = all(
+        _looks_encrypted(value)
+        for account in config.accounts
+        for value in (
+            account.credentials.app_key,
+            account.credentials.app_secret,
+            account.credentials.account_number,
+        )
+    )
+    if not all_encrypted:
+        return
+
+    payload = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "config": config.model_dump(mode="json"),
+    }
+    sidecar = _sidecar_path(config_file)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        # Caching is best-effort; an unwritable config directory is fine
+        tmp_path.unlink(missing_ok=True)
+
+
+def _looks_encrypted(value: str) -> bool:
+    """Return True if value has the shape of a Fernet token."""
+    # Fernet tokens are urlsafe-base64 starting with version byte 0x80
+    return len(value) > 80 and value.startswith("gAAAAA")
 
 
 def decrypt_credentials(
@@ -127,11 +250,16 @@ def decrypt_credentials(
     Returns:
         AccountCredentials: Credentials with decrypted values
     """
+    fields = (credentials.app_key, credentials.app_secret, credentials.account_number)
+    if not all(_looks_encrypted(value) for value in fields):
+        # Plaintext credentials; skip the failing decrypt attempts
+        return credentials
+
     try:
         # Try to decrypt each field
-        app_key = decrypt(credentials.app_key, encryption_key)
-        app_secret = decrypt(credentials.app_secret, encryption_key)
-        account_number = decrypt(credentials.account_number, encryption_key)
+        app_key, app_secret, account_number = (
+            decrypt(value, encryption_key) for value in fields
+        )
 
         return AccountCredentials(
             app_key=app_key, app_secret=app_secret, account_number=account_number
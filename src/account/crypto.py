@@ -2,6 +2,7 @@
 
 import base64
 import os
+from functools import lru_cache
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -17,6 +18,12 @@ def generate_key() -> str:
     return Fernet.generate_key().decode("utf-8")
 
 
+@lru_cache(maxsize=8)
+def _fernet(key: str) -> Fernet:
+    """Return a cached Fernet instance for the given key."""
+    return Fernet(key.encode("utf-8"))
+
+
 def encrypt(plaintext: str, key: str) -> str:
     """
     Encrypt plaintext using Fernet symmetric encryption.
@@ -28,15 +35,19 @@ def encrypt(plaintext: str, key: str) -> str:
     Returns:
         str: Encrypted ciphertext (URL-safe base64-encoded)
     """
-    f = Fernet(key.encode("utf-8"))
-    encrypted = f.encrypt(plaintext.encode("utf-8"))
+    encrypted = _fernet(key).encrypt(plaintext.encode("utf-8"))
     return encrypted.decode("utf-8")
 
 
+@lru_cache(maxsize=256)
 def decrypt(ciphertext: str, key: str) -> str:
     """
     Decrypt ciphertext using Fernet symmetric encryption.
 
+    Results are memoized per (ciphertext, key), so decrypted plaintext stays
+    in process memory for the lifetime of the cache. Call
+    ``decrypt.cache_clear()`` to drop it.
+
     Args:
         ciphertext: The encrypted text (URL-safe base64-encoded)
         key: URL-safe base64-encoded Fernet key
@@ -47,8 +58,7 @@ def decrypt(ciphertext: str, key: str) -> str:
     Raises:
         cryptography.fernet.InvalidToken: If decryption fails
     """
-    f = Fernet(key.encode("utf-8"))
-    decrypted = f.decrypt(ciphertext.encode("utf-8"))
+    decrypted = _fernet(key).decrypt(ciphertext.encode("utf-8"))
     return decrypted.decode("utf-8")
 
 
@@ -1,25 +1,95 @@
 """Logging configuration for account operations."""
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import threading
 from functools import wraps
 
 
-# Ensure logs directory exists
-os.makedirs("logs", exist_ok=True)
+logger = logging.getLogger("account")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("logs/account-integration.log"),
-        logging.StreamHandler(),
-    ],
-)
+_configured = False
+_configure_lock = threading.Lock()
 
-logger = logging.getLogger("account")
+
+def configure_logging() -> None:
+    """
+    Set up account logging handlers on first call; later calls are no-ops.
+
+    Creates the logs directory and installs a queue-based handler on the root
+    logger. Records are queued by the calling thread and written to the file
+    and stream handlers by a single background listener, so API calls never
+    block on log I/O. Like basicConfig, handler setup is skipped if the root
+    logger is already configured.
+
+    Importing this module does none of this; the service, scheduler, Slack
+    client and log_api_call call it before they log.
+    """
+    global _configured
+    if _configured:
+        return
+
+    with _configure_lock:
+        if _configured:
+            return
+
+        root = logging.getLogger()
+        if not root.handlers:
+            # Ensure logs directory exists
+            os.makedirs("logs", exist_ok=True)
+
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+            handlers = [
+                logging.FileHandler("logs/account-integration.log"),
+                logging.StreamHandler(),
+            ]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+
+            log_queue = queue.SimpleQueue()
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+            root.setLevel(logging.INFO)
+
+            listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+
+        _configured = True
+
+
+def get_logger() -> logging.Logger:
+    """
+    Return the account logger, configuring handlers on first call.
+
+    Returns:
+        logging.Logger: The "account" logger
+    """
+    configure_logging()
+    return logger
+
+
+# Sensitive patterns, combined into a single pass; each named group maps to
+# its replacement in _REDACTIONS
+_REDACT_RE = re.compile(
+    r"(?P<bearer>Bearer [A-Za-z0-9_-]+)"
+    r'|(?P<app_key>"app_key":\s*"[^"]+)'
+    r'|(?P<app_secret>"app_secret":\s*"[^"]+)'
+    r'|(?P<webhook>https://hooks\.slack\.com/services/[^\s"]+)'
+)
+_REDACTIONS = {
+    "bearer": "Bearer [REDACTED]",
+    "app_key": '"app_key": "[REDACTED]',
+    "app_secret": '"app_secret": "[REDACTED]',
+    "webhook": "https://hooks.slack.com/services/[REDACTED]",
+}
 
 
 def redact_credentials(text: str) -> str:
@@ -32,21 +102,7 @@ def redact_credentials(text: str) -> str:
     Returns:
         str: Text with credentials redacted
     """
-    # Redact tokens
-    text = re.sub(r"Bearer [A-Za-z0-9_-]+", "Bearer [REDACTED]", text)
-
-    # Redact API keys
-    text = re.sub(r'"app_key":\s*"[^"]+', '"app_key": "[REDACTED]', text)
-    text = re.sub(r'"app_secret":\s*"[^"]+', '"app_secret": "[REDACTED]', text)
-
-    # Redact webhook URLs
-    text = re.sub(
-        r'https://hooks\.slack\.com/services/[^\s"]+',
-        "https://hooks.slack.com/services/[REDACTED]",
-        text,
-    )
-
-    return text
+    return _REDACT_RE.sub(lambda m: _REDACTIONS[m.lastgroup], text)
 
 
 def log_api_call(func):
@@ -62,16 +118,19 @@ def log_api_call(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
+        configure_logging()
         func_name = func.__name__
-        logger.info(f"API call: {func_name}")
+        logger.info("API call: %s", func_name)
 
         try:
             result = func(*args, **kwargs)
-            logger.info(f"API call successful: {func_name}")
+            logger.info("API call successful: %s", func_name)
             return result
         except Exception as e:
-            error_msg = redact_credentials(str(e))
-            logger.error(f"API call failed: {func_name} - {error_msg}")
+            # Skip the redaction scan when errors would not be emitted
+            if logger.isEnabledFor(logging.ERROR):
+                error_msg = redact_credentials(str(e))
+                logger.error("API call failed: %s - %s", func_name, error_msg)
             raise
 
     return wrapper
@@ -128,12 +128,12 @@ class AccountHoldings:
         from src.models.portfolio_state import PortfolioState
 
         # Convert positions to asset_holdings dict {symbol: quantity}
-        asset_holdings: Dict[str, Decimal] = {}
-        current_prices: Dict[str, Decimal] = {}
-
-        for position in self.positions:
-            asset_holdings[position.symbol] = position.quantity
-            current_prices[position.symbol] = position.current_price
+        asset_holdings: Dict[str, Decimal] = {
+            position.symbol: position.quantity for position in self.positions
+        }
+        current_prices: Dict[str, Decimal] = {
+            position.symbol: position.current_price for position in self.positions
+        }
 
         return PortfolioState(
             timestamp=self.timestamp.date(),  # Convert datetime to date
@@ -2,9 +2,10 @@
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from src.account.providers.base import AccountProvider
 from src.account.models import (
@@ -21,6 +22,59 @@ from src.account.client import with_retry
 
 logger = logging.getLogger(__name__)
 
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+
+
+def _dec(
+    data: Dict[str, Any], key: str, default: Optional[Decimal] = _ZERO
+) -> Optional[Decimal]:
+    """
+    Parse a numeric API field as Decimal.
+
+    Args:
+        data: API response record
+        key: Field name
+        default: Value returned when the field is missing or empty
+
+    Returns:
+        Decimal value of the field, or default
+    """
+    value = data.get(key)
+    return Decimal(value) if value else default
+
+
+def _split_domestic_payload(output1: Any, output2: Any) -> Tuple[dict, list]:
+    """
+    Normalize the domestic balance response into (summary, stock list).
+
+    Handles the different response structures:
+    - When holdings exist: output1=dict (summary), output2=list (stocks)
+    - List output1 with stock rows: output1=stocks, output2=[summary]
+    - List output1 with a summary row: output1=[summary], no stocks
+    - When no holdings: output1=list (empty), output2=list (summary)
+
+    Args:
+        output1: "output1" field of the API response
+        output2: "output2" field of the API response
+
+    Returns:
+        tuple: (summary dict, list of stock records)
+    """
+    if isinstance(output1, dict):
+        # Mock/test data structure or some API responses
+        return output1, output2
+
+    first_summary = output2[0] if output2 else {}
+    if not output1:
+        # Empty output1, use output2 for summary
+        return first_summary, []
+    if "pdno" in output1[0]:
+        # output1 contains stocks
+        return first_summary, output1
+    # output1 contains summary
+    return output1[0], []
+
 
 class KoreaInvestmentProvider(AccountProvider):
     """
@@ -36,9 +90,33 @@ class KoreaInvestmentProvider(AccountProvider):
         "/uapi/overseas-stock/v1/trading/inquire-present-balance"
     )
 
+    # Full endpoint URLs, built once at class definition
+    AUTH_URL = BASE_URL + AUTH_ENDPOINT
+    DOMESTIC_HOLDINGS_URL = BASE_URL + DOMESTIC_HOLDINGS_ENDPOINT
+    OVERSEAS_HOLDINGS_URL = BASE_URL + OVERSEAS_HOLDINGS_ENDPOINT
+
     def __init__(self):
-        """Initialize provider with rate limiter."""
-        self.rate_limiter = RateLimiter(delay=1.1)
+        """Initialize provider with rate limiter and pooled HTTP session."""
+        # Burst of 2 lets the domestic and overseas calls of one fetch go out
+        # back-to-back while keeping the long-run 1.1s spacing
+        self.rate_limiter = RateLimiter(delay=1.1, burst=2)
+
+        # Reuse TLS connections to the API across auth and holdings calls
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager and close the HTTP session."""
+        self.close()
+        return False
 
     def authenticate(
         self, account: BrokerageAccount, credentials: AccountCredentials
@@ -56,7 +134,7 @@ class KoreaInvestmentProvider(AccountProvider):
         Raises:
             AccountAuthException: If authentication fails
         """
-        url = f"{self.BASE_URL}{self.AUTH_ENDPOINT}"
+        url = self.AUTH_URL
 
         payload = {
             "grant_type": "client_credentials",
@@ -66,7 +144,7 @@ class KoreaInvestmentProvider(AccountProvider):
 
         try:
             with self.rate_limiter:
-                response = requests.post(url, json=payload, timeout=30)
+                response = self.session.post(url, json=payload, timeout=30)
 
             if response.status_code != 200:
                 raise AccountAuthException(
@@ -118,15 +196,34 @@ class KoreaInvestmentProvider(AccountProvider):
         if not credentials:
             raise AccountAuthException("Credentials are required for API calls")
 
+        # One timestamp for the whole fetch so merged parts agree
+        timestamp = datetime.now(timezone.utc)
+
         # Fetch domestic and overseas holdings
-        domestic = self._fetch_domestic_holdings(account, credentials)
-        overseas = self._fetch_overseas_holdings(account, credentials)
+        domestic = self._fetch_domestic_holdings(account, credentials, timestamp)
+        overseas = self._fetch_overseas_holdings(account, credentials, timestamp)
 
         # Merge results
-        return self._merge_holdings(account.account_id, domestic, overseas)
+        return self._merge_holdings(account.account_id, domestic, overseas, timestamp)
+
+    @staticmethod
+    def _split_account_number(account: BrokerageAccount) -> Tuple[str, str]:
+        """
+        Split account number into CANO and ACNT_PRDT_CD request fields.
+
+        Args:
+            account: Brokerage account
+
+        Returns:
+            tuple: (first 8 digits, last 2 digits)
+        """
+        return account.account_number[:8], account.account_number[8:10]
 
     def _fetch_domestic_holdings(
-        self, account: BrokerageAccount, credentials: AccountCredentials
+        self,
+        account: BrokerageAccount,
+        credentials: AccountCredentials,
+        timestamp: Optional[datetime] = None,
     ) -> AccountHoldings:
         """
         Fetch domestic stock holdings.
@@ -134,6 +231,7 @@ class KoreaInvestmentProvider(AccountProvider):
         Args:
             account: Authenticated account
             credentials: API credentials
+            timestamp: Fetch timestamp (defaults to now)
 
         Returns:
             AccountHoldings: Domestic stock holdings
@@ -141,11 +239,8 @@ class KoreaInvestmentProvider(AccountProvider):
         Raises:
             AccountAPIException: If API request fails
         """
-        url = f"{self.BASE_URL}{self.DOMESTIC_HOLDINGS_ENDPOINT}"
-
-        # Split account number: first 8 digits + last 2 digits
-        cano = account.account_number[:8]
-        acnt_prdt_cd = account.account_number[8:10]
+        url = self.DOMESTIC_HOLDINGS_URL
+        cano, acnt_prdt_cd = self._split_account_number(account)
 
         headers = {
             "authorization": f"Bearer {account.access_token}",
@@ -170,7 +265,9 @@ class KoreaInvestmentProvider(AccountProvider):
 
         try:
             with self.rate_limiter:
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = self.session.get(
+                    url, headers=headers, params=params, timeout=30
+                )
 
             if response.status_code != 200:
                 raise AccountAPIException(
@@ -178,7 +275,9 @@ class KoreaInvestmentProvider(AccountProvider):
                 )
 
             data = response.json()
-            return self._parse_domestic_holdings_response(account.account_id, data)
+            return self._parse_domestic_holdings_response(
+                account.account_id, data, timestamp
+            )
 
         except requests.Timeout:
             raise AccountAPIException("Request timeout")
@@ -186,7 +285,10 @@ class KoreaInvestmentProvider(AccountProvider):
             raise AccountAPIException(f"Network error: {str(e)}")
 
     def _parse_domestic_holdings_response(
-        self, account_id: str, data: Dict[str, Any]
+        self,
+        account_id: str,
+        data: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
     ) -> AccountHoldings:
         """
         Parse domestic stock API response into AccountHoldings.
@@ -194,66 +296,47 @@ class KoreaInvestmentProvider(AccountProvider):
         Args:
             account_id: Account identifier
             data: API response data
+            timestamp: Fetch timestamp (defaults to now)
 
         Returns:
             AccountHoldings: Parsed domestic holdings
         """
-        output1 = data.get("output1", [])
-        output2 = data.get("output2", [])
-
-        # Handle different response structures:
-        # - When holdings exist: output1=dict (summary), output2=list (stocks)
-        # - When no holdings: output1=list (empty), output2=list (summary)
-        if isinstance(output1, dict):
-            # Mock/test data structure or some API responses
-            summary = output1
-            stock_list = output2  # output2 contains stock positions
-        elif isinstance(output1, list) and len(output1) > 0:
-            # List with stock data
-            if "pdno" in output1[0]:
-                # output1 contains stocks
-                summary = output2[0] if len(output2) > 0 else {}
-                stock_list = output1
-            else:
-                # output1 contains summary
-                summary = output1[0]
-                stock_list = []
-        else:
-            # Empty output1, use output2 for summary
-            summary = output2[0] if len(output2) > 0 else {}
-            stock_list = []
+        summary, stock_list = _split_domestic_payload(
+            data.get("output1", []), data.get("output2", [])
+        )
 
         # Parse cash balance and total value
-        cash_balance = Decimal(summary.get("dnca_tot_amt", "0"))
-        total_value = Decimal(summary.get("tot_evlu_amt", "0"))
+        cash_balance = _dec(summary, "dnca_tot_amt")
+        total_value = _dec(summary, "tot_evlu_amt")
 
         # Parse positions
-        positions = []
-        for item in stock_list:
-            position = SecurityPosition(
+        positions = [
+            SecurityPosition(
                 symbol=item.get("pdno", ""),
                 name=item.get("prdt_name", ""),
-                quantity=Decimal(item.get("hldg_qty", "0")),
-                average_price=Decimal(item.get("pchs_avg_pric", "0")),
-                current_price=Decimal(item.get("prpr", "0")),
-                current_value=Decimal(item.get("evlu_amt", "0")),
+                quantity=_dec(item, "hldg_qty"),
+                average_price=_dec(item, "pchs_avg_pric"),
+                current_price=_dec(item, "prpr"),
+                current_value=_dec(item, "evlu_amt"),
                 asset_type=AssetType.STOCK,
-                profit_loss=Decimal(item.get("evlu_pfls_amt", "0"))
-                if item.get("evlu_pfls_amt")
-                else None,
+                profit_loss=_dec(item, "evlu_pfls_amt", default=None),
             )
-            positions.append(position)
+            for item in stock_list
+        ]
 
         return AccountHoldings(
             account_id=account_id,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or datetime.now(timezone.utc),
             cash_balance=cash_balance,
             positions=positions,
             total_value=total_value,
         )
 
     def _fetch_overseas_holdings(
-        self, account: BrokerageAccount, credentials: AccountCredentials
+        self,
+        account: BrokerageAccount,
+        credentials: AccountCredentials,
+        timestamp: Optional[datetime] = None,
     ) -> AccountHoldings:
         """
         Fetch overseas stock holdings.
@@ -261,6 +344,7 @@ class KoreaInvestmentProvider(AccountProvider):
         Args:
             account: Authenticated account
             credentials: API credentials
+            timestamp: Fetch timestamp (defaults to now)
 
         Returns:
             AccountHoldings: Overseas stock holdings (USD cash converted to KRW + positions)
@@ -268,11 +352,8 @@ class KoreaInvestmentProvider(AccountProvider):
         Raises:
             AccountAPIException: If API request fails
         """
-        url = f"{self.BASE_URL}{self.OVERSEAS_HOLDINGS_ENDPOINT}"
-
-        # Split account number: first 8 digits + last 2 digits
-        cano = account.account_number[:8]
-        acnt_prdt_cd = account.account_number[8:10]
+        url = self.OVERSEAS_HOLDINGS_URL
+        cano, acnt_prdt_cd = self._split_account_number(account)
 
         headers = {
             "authorization": f"Bearer {account.access_token}",
@@ -292,7 +373,9 @@ class KoreaInvestmentProvider(AccountProvider):
 
         try:
             with self.rate_limiter:
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = self.session.get(
+                    url, headers=headers, params=params, timeout=30
+                )
 
             if response.status_code != 200:
                 raise AccountAPIException(
@@ -311,13 +394,15 @@ class KoreaInvestmentProvider(AccountProvider):
                 # Return empty holdings on error
                 return AccountHoldings(
                     account_id=account.account_id,
-                    timestamp=datetime.now(timezone.utc),
-                    cash_balance=Decimal("0"),
+                    timestamp=timestamp or datetime.now(timezone.utc),
+                    cash_balance=_ZERO,
                     positions=[],
-                    total_value=Decimal("0"),
+                    total_value=_ZERO,
                 )
 
-            return self._parse_overseas_holdings_response(account.account_id, data)
+            return self._parse_overseas_holdings_response(
+                account.account_id, data, timestamp
+            )
 
         except requests.Timeout:
             raise AccountAPIException("Request timeout")
@@ -325,7 +410,10 @@ class KoreaInvestmentProvider(AccountProvider):
             raise AccountAPIException(f"Network error: {str(e)}")
 
     def _parse_overseas_holdings_response(
-        self, account_id: str, data: Dict[str, Any]
+        self,
+        account_id: str,
+        data: Dict[str, Any],
+        timestamp: Optional[datetime] = None,
     ) -> AccountHoldings:
         """
         Parse overseas stock API response into AccountHoldings.
@@ -333,6 +421,7 @@ class KoreaInvestmentProvider(AccountProvider):
         Args:
             account_id: Account identifier
             data: API response data
+            timestamp: Fetch timestamp (defaults to now)
 
         Returns:
             AccountHoldings: Parsed overseas holdings (USD converted to KRW)
@@ -348,15 +437,13 @@ class KoreaInvestmentProvider(AccountProvider):
 
         # Parse cash balance (in original currency, usually USD)
         # Convert to KRW using exchange rate from response
-        cash_balance_usd = Decimal(
-            summary.get("frcr_dncl_amt_2", "0")
-        )  # Foreign currency deposit amount
-        exchange_rate = Decimal(
-            summary.get("frst_bltn_exrt", "1")
-        )  # Exchange rate (first bulletin exchange rate)
+        # Foreign currency deposit amount
+        cash_balance_usd = _dec(summary, "frcr_dncl_amt_2")
+        # Exchange rate (first bulletin exchange rate)
+        exchange_rate = _dec(summary, "frst_bltn_exrt", default=_ONE)
 
         # Validate exchange rate to prevent valuation errors
-        if exchange_rate == Decimal("1") and cash_balance_usd > 0:
+        if exchange_rate == _ONE and cash_balance_usd > 0:
             logger.warning(
                 f"Exchange rate is 1.0 for account {account_id} with USD balance ${cash_balance_usd}. "
                 "This may indicate missing exchange rate data from API."
@@ -365,57 +452,33 @@ class KoreaInvestmentProvider(AccountProvider):
         cash_balance_krw = cash_balance_usd * exchange_rate
 
         # Total value in KRW (evaluation amount)
-        total_value_krw = Decimal(
-            summary.get("frcr_evlu_amt2", "0")
-        )  # Foreign currency evaluation amount in KRW
+        # Foreign currency evaluation amount in KRW
+        total_value_krw = _dec(summary, "frcr_evlu_amt2")
 
-        # Parse positions
+        # Parse positions; prices arrive in USD and are converted to KRW,
+        # evaluation and P/L amounts are already in KRW
         positions = []
         for item in output1:
-            # Stock info from overseas API
-            symbol = item.get("ovrs_pdno", "")  # Overseas product number (ticker)
-            name = item.get("ovrs_item_name", "")  # Overseas item name
-            quantity = Decimal(
-                item.get("ovrs_cblc_qty", "0")
-            )  # Overseas balance quantity
-
-            # Prices in USD
-            avg_price_usd = Decimal(
-                item.get("pchs_avg_pric", "0")
-            )  # Purchase average price
-            current_price_usd = Decimal(
-                item.get("ovrs_now_pric1", "0")
-            )  # Overseas current price
-
-            # Convert to KRW
-            avg_price_krw = avg_price_usd * exchange_rate
-            current_price_krw = current_price_usd * exchange_rate
-            current_value_krw = Decimal(
-                item.get("ovrs_stck_evlu_amt", "0")
-            )  # Overseas stock evaluation amount
-
-            profit_loss_krw = (
-                Decimal(item.get("evlu_pfls_amt", "0"))
-                if item.get("evlu_pfls_amt")
-                else None
-            )
-
-            if quantity > 0:  # Only include if there's actual holdings
-                position = SecurityPosition(
-                    symbol=symbol,
-                    name=name,
+            quantity = _dec(item, "ovrs_cblc_qty")  # Overseas balance quantity
+            if quantity <= 0:  # Only include if there's actual holdings
+                continue
+
+            positions.append(
+                SecurityPosition(
+                    symbol=item.get("ovrs_pdno", ""),  # Overseas ticker
+                    name=item.get("ovrs_item_name", ""),  # Overseas item name
                     quantity=quantity,
-                    average_price=avg_price_krw,
-                    current_price=current_price_krw,
-                    current_value=current_value_krw,
+                    average_price=_dec(item, "pchs_avg_pric") * exchange_rate,
+                    current_price=_dec(item, "ovrs_now_pric1") * exchange_rate,
+                    current_value=_dec(item, "ovrs_stck_evlu_amt"),
                     asset_type=AssetType.STOCK,
-                    profit_loss=profit_loss_krw,
+                    profit_loss=_dec(item, "evlu_pfls_amt", default=None),
                 )
-                positions.append(position)
+            )
 
         return AccountHoldings(
             account_id=account_id,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or datetime.now(timezone.utc),
             cash_balance=cash_balance_krw,
             positions=positions,
             total_value=total_value_krw,
@@ -424,7 +487,11 @@ class KoreaInvestmentProvider(AccountProvider):
         )
 
     def _merge_holdings(
-        self, account_id: str, domestic: AccountHoldings, overseas: AccountHoldings
+        self,
+        account_id: str,
+        domestic: AccountHoldings,
+        overseas: AccountHoldings,
+        timestamp: Optional[datetime] = None,
     ) -> AccountHoldings:
         """
         Merge domestic and overseas holdings.
@@ -433,6 +500,7 @@ class KoreaInvestmentProvider(AccountProvider):
             account_id: Account identifier
             domestic: Domestic stock holdings (KRW)
             overseas: Overseas stock holdings (USD converted to KRW)
+            timestamp: Fetch timestamp (defaults to now)
 
         Returns:
             AccountHoldings: Merged holdings with currency breakdown
@@ -448,7 +516,7 @@ class KoreaInvestmentProvider(AccountProvider):
 
         return AccountHoldings(
             account_id=account_id,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=timestamp or datetime.now(timezone.utc),
             cash_balance=total_cash,
             positions=all_positions,
             total_value=total_value,
@@ -7,40 +7,54 @@ from typing import Optional
 
 class RateLimiter:
     """
-    Rate limiter to ensure minimum delay between operations.
+    Token-bucket rate limiter for API requests.
 
-    Uses a simple time-based approach to enforce rate limits by tracking
-    the last operation time and waiting if necessary.
+    Tokens refill at one per `delay` seconds up to `burst` tokens, and each
+    operation consumes one token, waiting for a refill when the bucket is
+    empty. With the default burst of 1 this enforces a minimum delay
+    between operations; a larger burst lets short runs of requests go out
+    back-to-back while keeping the same long-run rate.
 
     Attributes:
-        delay: Minimum seconds between operations
+        delay: Seconds per token refill (long-run spacing between operations)
+        burst: Maximum number of operations allowed without waiting
     """
 
-    def __init__(self, delay: float):
+    def __init__(self, delay: float, burst: int = 1):
         """
         Initialize rate limiter.
 
         Args:
             delay: Minimum seconds to wait between operations
+            burst: Number of operations allowed back-to-back (default: 1)
         """
         self.delay = delay
-        self._last_operation: Optional[float] = None
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill: Optional[float] = None
         self._lock = threading.Lock()
 
     def wait(self) -> None:
         """
         Wait if necessary to enforce rate limit.
 
-        Calculates time since last operation and sleeps if needed
-        to maintain the configured delay between operations.
+        Refills tokens for the time elapsed since the last operation and
+        sleeps until a token is available if the bucket is empty.
         """
         with self._lock:
-            if self._last_operation is not None:
-                elapsed = time.time() - self._last_operation
-                if elapsed < self.delay:
-                    sleep_time = self.delay - elapsed
-                    time.sleep(sleep_time)
-            self._last_operation = time.time()
+            now = time.monotonic()
+            if self._last_refill is not None and self.delay > 0:
+                refilled = (now - self._last_refill) / self.delay
+                self._tokens = min(self.burst, self._tokens + refilled)
+            self._last_refill = now
+
+            if self._tokens < 1 and self.delay > 0:
+                sleep_time = (1 - self._tokens) * self.delay
+                time.sleep(sleep_time)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+
+            self._tokens = max(0.0, self._tokens - 1)
 
     def __enter__(self):
         """Context manager entry - enforces rate limit."""
@@ -2,7 +2,7 @@
 
 import threading
 from typing import Optional, Callable
-from src.account.logging import logger
+from src.account.logging import configure_logging, logger
 
 
 class Scheduler:
@@ -23,6 +23,7 @@ class Scheduler:
 
     def start(self):
         """Start the scheduler in a background thread."""
+        configure_logging()
         if self._thread and self._thread.is_alive():
             logger.info("Scheduler already running")
             return
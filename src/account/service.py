@@ -1,5 +1,7 @@
 """Account service layer for high-level operations."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from src.account.models import (
     BrokerageAccount,
     AccountHoldings,
@@ -9,9 +11,12 @@ from src.account.models import (
 from decimal import Decimal
 from src.account.auth import authenticate, get_provider
 from src.account.config import load_config
-from src.account.logging import logger
+from src.account.logging import configure_logging, logger
 from src.account.token_cache import TokenCache
 
+# Upper bound on concurrent account fetches in get_all_holdings
+MAX_FETCH_WORKERS = 8
+
 
 class AccountService:
     """Service for managing brokerage account operations."""
@@ -23,6 +28,7 @@ class AccountService:
         Args:
             config_path: Path to configuration file
         """
+        configure_logging()
         self.config = load_config(config_path)
         self._token_cache = TokenCache()  # File-based token cache
 
@@ -86,7 +92,7 @@ class AccountService:
             logger.info(f"Using cached token from disk for account: {account_name}")
 
         # Fetch holdings
-        provider = get_provider(account.provider)
+        provider = get_provider(account.provider, account_config.credentials.app_key)
         holdings = provider.fetch_holdings(account, account_config.credentials)
 
         # Validate holdings
@@ -130,22 +136,31 @@ class AccountService:
         """
         Get holdings for all enabled accounts.
 
+        Accounts are fetched concurrently; results keep configuration order.
+
         Returns:
             dict: Account name -> AccountHoldings mapping
         """
         all_holdings = {}
-
-        for account_config in self.config.accounts:
-            if not account_config.enabled:
-                continue
-
-            try:
-                holdings = self.get_holdings(account_config.name)
-                all_holdings[account_config.name] = holdings
-            except Exception as e:
-                # Log error but continue with other accounts
-                logger.warning(f"Failed to fetch {account_config.name}: {e}")
-                continue
+        account_names = [acc.name for acc in self.config.accounts if acc.enabled]
+
+        if not account_names:
+            return all_holdings
+
+        # Fetch accounts concurrently (network-bound); collect in config order
+        max_workers = min(MAX_FETCH_WORKERS, len(account_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (name, executor.submit(self.get_holdings, name))
+                for name in account_names
+            ]
+
+            for name, future in futures:
+                try:
+                    all_holdings[name] = future.result()
+                except Exception as e:
+                    # Log error but continue with other accounts
+                    logger.warning(f"Failed to fetch {name}: {e}")
 
         return all_holdings
 
@@ -1,8 +1,10 @@
 """Token caching for persistent authentication across CLI sessions."""
 
+import functools
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -15,6 +17,17 @@ from src.account.models import BrokerageAccount, AccountStatus
 logger = logging.getLogger(__name__)
 
 
+def _synchronized(method):
+    """Run a TokenCache method while holding the instance lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class TokenCache:
     """
     File-based token cache for persistent authentication.
@@ -33,7 +46,11 @@ class TokenCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(mode=0o700, exist_ok=True)  # Restrictive permissions
         self.cache_file = self.cache_dir / "tokens.enc"
+        # Serializes read-modify-write of the cache file across threads
+        # (re-entrant because get() may call remove())
+        self._lock = threading.RLock()
 
+    @_synchronized
     def get(self, account_id: str) -> Optional[BrokerageAccount]:
         """
         Get cached account with token if valid.
@@ -94,6 +111,7 @@ class TokenCache:
             logger.error(f"Unexpected error reading token cache for {account_id}: {e}")
             raise
 
+    @_synchronized
     def set(self, account: BrokerageAccount) -> None:
         """
         Cache an authenticated account.
@@ -149,6 +167,7 @@ class TokenCache:
         # Ensure permissions are correct (in case umask interfered)
         os.chmod(self.cache_file, 0o600)
 
+    @_synchronized
     def remove(self, account_id: str) -> None:
         """
         Remove an account from cache.
@@ -185,6 +204,7 @@ class TokenCache:
             logger.error(f"Error removing from token cache: {e}")
             raise
 
+    @_synchronized
     def clear(self) -> None:
         """Clear all cached tokens."""
         if self.cache_file.exists():
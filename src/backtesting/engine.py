@@ -4,6 +4,7 @@ import logging
 from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 from ..models.backtest_config import BacktestConfiguration, TransactionCosts
@@ -14,11 +15,20 @@ from ..models.performance import PerformanceMetrics
 from .exceptions import DataError
 from .price_window import InsufficientDataError
 from . import metrics
-from .rebalancer import generate_rebalancing_dates, calculate_rebalancing_trades
+from .rebalancer import (
+    QUANTITY_PRECISION,
+    ZERO,
+    generate_rebalancing_dates,
+    calculate_rebalancing_trades,
+)
 
 # Minimum trade quantity threshold to skip negligible trades
 MIN_TRADE_QUANTITY = Decimal("0.000001")
 
+# Rounding precision for prices and cash amounts
+PRICE_PRECISION = Decimal("0.0001")
+CASH_PRECISION = Decimal("0.01")
+
 
 @dataclass
 class BacktestResult:
@@ -63,18 +73,20 @@ class BacktestEngine:
         trades = []
         portfolio_history = []
 
-        # Get list of trading dates
-        trading_dates = pd.to_datetime(price_data["date"]).unique()
-        trading_dates = sorted([d.date() for d in trading_dates])
-
-        # Filter to backtest period
-        trading_dates = [
-            d for d in trading_dates if config.start_date <= d <= config.end_date
-        ]
+        # Get sorted trading dates within the backtest period
+        all_dates = pd.DatetimeIndex(pd.to_datetime(price_data["date"]).unique())
+        all_dates = all_dates.sort_values()
+        in_period = (all_dates >= pd.Timestamp(config.start_date)) & (
+            all_dates <= pd.Timestamp(config.end_date)
+        )
+        trading_dates = [d.date() for d in all_dates[in_period]]
 
         if not trading_dates:
             raise DataError("No trading dates in backtest period")
 
+        # Pivot once to a date x symbol table for per-day price lookups
+        price_table = self._build_price_table(price_data)
+
         # Initialize portfolio on first day
         first_date = trading_dates[0]
 
@@ -84,7 +96,7 @@ class BacktestEngine:
         )
 
         prices_first = self._get_prices_for_date(
-            price_data, first_date, list(current_weights.keys())
+            price_table, first_date, list(current_weights.keys())
         )
 
         portfolio = self._initialize_portfolio(
@@ -100,7 +112,7 @@ class BacktestEngine:
                     quantity=quantity,
                     price=prices_first[symbol],
                     currency=config.base_currency,
-                    transaction_cost=Decimal("0"),  # Initial purchase, no cost
+                    transaction_cost=ZERO,  # Initial purchase, no cost
                 )
                 trades.append(trade)
 
@@ -114,11 +126,14 @@ class BacktestEngine:
         # Remove first date (already handled in initialization)
         if rebalancing_dates and rebalancing_dates[0] == first_date:
             rebalancing_dates = rebalancing_dates[1:]
+        # Set for O(1) membership checks in the daily loop
+        rebalancing_dates = set(rebalancing_dates)
 
         # Simulate remaining days
         for current_date in trading_dates[1:]:
             # Check if rebalancing is needed
-            if current_date in rebalancing_dates:
+            is_rebalancing_day = current_date in rebalancing_dates
+            if is_rebalancing_day:
                 # Get new weights for dynamic strategies
                 new_weights = self._get_strategy_weights(
                     strategy, current_date, price_data, previous_weights=current_weights
@@ -127,7 +142,7 @@ class BacktestEngine:
 
             # Get current prices for all assets in current allocation
             current_prices = self._get_prices_for_date(
-                price_data, current_date, list(current_weights.keys())
+                price_table, current_date, list(current_weights.keys())
             )
 
             # Update portfolio state with current prices
@@ -139,7 +154,7 @@ class BacktestEngine:
             )
 
             # Execute rebalancing if needed
-            if current_date in rebalancing_dates:
+            if is_rebalancing_day:
                 portfolio, rebalance_trades = self._rebalance_portfolio(
                     portfolio, current_weights, config
                 )
@@ -188,7 +203,7 @@ class BacktestEngine:
             quantity = target_value / price
 
             # Round to 6 decimal places
-            quantity = quantity.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+            quantity = quantity.quantize(QUANTITY_PRECISION, rounding=ROUND_HALF_UP)
 
             asset_holdings[symbol] = quantity
 
@@ -200,7 +215,7 @@ class BacktestEngine:
         cash_balance = initial_capital - total_invested
 
         # Round cash to 2 decimal places
-        cash_balance = cash_balance.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        cash_balance = cash_balance.quantize(CASH_PRECISION, rounding=ROUND_HALF_UP)
 
         return PortfolioState(
             timestamp=timestamp,
@@ -209,9 +224,24 @@ class BacktestEngine:
             current_prices=initial_prices,
         )
 
+    def _build_price_table(self, price_data: pd.DataFrame) -> pd.DataFrame:
+        """Pivot long-format price data into a date x symbol table.
+
+        Args:
+            price_data: Historical price DataFrame with columns [date, symbol, price]
+
+        Returns:
+            DataFrame indexed by sorted date with one price column per symbol
+        """
+        # Keep the first row for any duplicated (date, symbol) pair
+        unique_rows = price_data.drop_duplicates(subset=["date", "symbol"])
+        price_table = unique_rows.pivot(index="date", columns="symbol", values="price")
+        price_table.index = pd.to_datetime(price_table.index)
+        return price_table.sort_index()
+
     def _get_prices_for_date(
         self,
-        price_data: pd.DataFrame,
+        price_table: pd.DataFrame,
         target_date: date,
         symbols: list[str],
         max_lookback_days: int = 5,
@@ -222,7 +252,7 @@ class BacktestEngine:
         to find the most recent available price.
 
         Args:
-            price_data: Historical price DataFrame
+            price_table: Date x symbol price table from _build_price_table
             target_date: Date to get prices for
             symbols: List of symbols to get prices for
             max_lookback_days: Maximum days to look back for missing data
@@ -235,39 +265,43 @@ class BacktestEngine:
         """
         prices = {}
 
-        for symbol in symbols:
-            price_found = False
-
-            # Try target date first, then look back up to max_lookback_days
-            for days_back in range(max_lookback_days + 1):
-                check_date = target_date - pd.Timedelta(days=days_back)
-                check_ts = pd.Timestamp(check_date)
+        # Binary-search the sorted date index once for the lookback window
+        target_ts = pd.Timestamp(target_date)
+        earliest_ts = target_ts - pd.Timedelta(days=max_lookback_days)
+        window_start = price_table.index.searchsorted(earliest_ts, side="left")
+        window_end = price_table.index.searchsorted(target_ts, side="right")
+        recent_prices = price_table.iloc[window_start:window_end]
 
-                symbol_data = price_data[
-                    (price_data["date"] == check_ts) & (price_data["symbol"] == symbol)
-                ]
-
-                if not symbol_data.empty:
-                    price = Decimal(str(symbol_data.iloc[0]["price"]))
+        for symbol in symbols:
+            available = (
+                recent_prices[symbol].dropna()
+                if symbol in recent_prices.columns
+                else None
+            )
 
-                    # Round to 4 decimal places
-                    price = price.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+            if available is None or available.empty:
+                raise DataError(
+                    f"No price data for {symbol} on {target_date} "
+                    f"(looked back {max_lookback_days} days)"
+                )
 
-                    prices[symbol] = price
-                    price_found = True
+            # Use the most recent available price (target date first)
+            price = Decimal(str(available.iat[-1]))
 
-                    if days_back > 0:
-                        logging.warning(
-                            f"Forward-filled {symbol} price: used {check_date} "
-                            f"data for {target_date} ({days_back} days back)"
-                        )
+            # Round to 4 decimal places
+            price = price.quantize(PRICE_PRECISION, rounding=ROUND_HALF_UP)
 
-                    break
+            prices[symbol] = price
 
-            if not price_found:
-                raise DataError(
-                    f"No price data for {symbol} on {target_date} "
-                    f"(looked back {max_lookback_days} days)"
+            price_date = available.index[-1]
+            days_back = (target_ts - price_date).days
+            if days_back > 0:
+                logging.warning(
+                    "Forward-filled %s price: used %s data for %s (%d days back)",
+                    symbol,
+                    price_date.date(),
+                    target_date,
+                    days_back,
                 )
 
         return prices
@@ -288,13 +322,15 @@ class BacktestEngine:
         Returns:
             PerformanceMetrics
         """
-        # Extract portfolio values
-        portfolio_values = pd.Series(
-            [float(state.total_value) for state in portfolio_history]
+        # Extract portfolio values into a preallocated float64 array
+        portfolio_values = np.fromiter(
+            (float(state.total_value) for state in portfolio_history),
+            dtype=np.float64,
+            count=len(portfolio_history),
         )
 
         # Calculate daily returns
-        daily_returns = portfolio_values.pct_change().dropna()
+        daily_returns = np.diff(portfolio_values) / portfolio_values[:-1]
 
         # Get start and end values
         start_value = portfolio_history[0].total_value
@@ -314,7 +350,7 @@ class BacktestEngine:
 
         # Calculate Sharpe ratio (handle zero volatility)
         if volatility == 0:
-            sharpe_ratio = Decimal("0")
+            sharpe_ratio = ZERO
         else:
             sharpe_ratio = metrics.calculate_sharpe_ratio(
                 annualized_return, volatility, config.risk_free_rate
@@ -354,6 +390,7 @@ class BacktestEngine:
 
         trades = []
         new_holdings = current_state.asset_holdings.copy()
+        total_transaction_costs = ZERO
 
         # Execute trades
         for symbol, quantity_change in trade_quantities.items():
@@ -377,14 +414,10 @@ class BacktestEngine:
                 transaction_cost=transaction_cost,
             )
             trades.append(trade)
+            total_transaction_costs += transaction_cost
 
             # Update holdings
-            new_holdings[symbol] = (
-                new_holdings.get(symbol, Decimal("0")) + quantity_change
-            )
-
-        # Calculate total transaction costs
-        total_transaction_costs = sum(trade.transaction_cost for trade in trades)
+            new_holdings[symbol] = new_holdings.get(symbol, ZERO) + quantity_change
 
         # Create new portfolio state
         new_state = PortfolioState(
@@ -416,7 +449,7 @@ class BacktestEngine:
         total_cost = fixed_cost + percentage_cost
 
         # Round to 2 decimal places
-        return total_cost.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return total_cost.quantize(CASH_PRECISION, rounding=ROUND_HALF_UP)
 
     def _get_strategy_weights(
         self,
@@ -453,8 +486,9 @@ class BacktestEngine:
             except InsufficientDataError as e:
                 if previous_weights:
                     logging.warning(
-                        f"Insufficient data for {calculation_date}: {e}. "
-                        f"Using previous weights."
+                        "Insufficient data for %s: %s. Using previous weights.",
+                        calculation_date,
+                        e,
                     )
                     return previous_weights
                 else:
@@ -4,6 +4,10 @@ import pandas as pd
 import numpy as np
 from decimal import Decimal, ROUND_HALF_UP
 
+# Trading days per year and its square root for annualizing volatility
+TRADING_DAYS_PER_YEAR = 252
+SQRT_TRADING_DAYS = float(np.sqrt(TRADING_DAYS_PER_YEAR))
+
 
 def calculate_total_return(initial_value: Decimal, final_value: Decimal) -> Decimal:
     """Calculate total return over backtest period.
@@ -42,20 +46,21 @@ def calculate_annualized_return(
         raise ValueError("Number of trading days must be positive")
 
     # Convert to float for power calculation, then back to Decimal
-    annualized = float(1 + total_return) ** (252 / num_trading_days) - 1
+    exponent = TRADING_DAYS_PER_YEAR / num_trading_days
+    annualized = float(1 + total_return) ** exponent - 1
     result = Decimal(str(annualized))
 
     # Round to 4 decimal places
     return result.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
 
 
-def calculate_volatility(daily_returns: pd.Series) -> Decimal:
+def calculate_volatility(daily_returns: pd.Series | np.ndarray) -> Decimal:
     """Calculate annualized volatility from daily returns.
 
     Formula: std(daily_returns) × sqrt(252)
 
     Args:
-        daily_returns: Series of daily returns
+        daily_returns: Series or array of daily returns
 
     Returns:
         Annualized volatility as decimal
@@ -63,11 +68,11 @@ def calculate_volatility(daily_returns: pd.Series) -> Decimal:
     if len(daily_returns) < 2:
         return Decimal("0")
 
-    # Calculate standard deviation
-    daily_std = daily_returns.std()
+    # Calculate sample standard deviation (ddof=1, NaN skipped as in pandas)
+    daily_std = np.nanstd(np.asarray(daily_returns, dtype=np.float64), ddof=1)
 
     # Annualize using square-root-of-time rule
-    annualized_vol = daily_std * np.sqrt(252)
+    annualized_vol = daily_std * SQRT_TRADING_DAYS
 
     result = Decimal(str(annualized_vol))
 
@@ -75,28 +80,50 @@ def calculate_volatility(daily_returns: pd.Series) -> Decimal:
     return result.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
 
 
-def calculate_max_drawdown(portfolio_values: pd.Series) -> Decimal:
+def calculate_max_drawdown(
+    portfolio_values: pd.Series | np.ndarray, lookback_days: int | None = None
+) -> Decimal:
     """Calculate maximum peak-to-trough decline.
 
     Formula: min((value - peak) / peak)
 
+    By default the peak is the running maximum since the start of the series.
+    With lookback_days, the peak is the maximum over the trailing window of
+    lookback_days observations (including the current one), so drawdowns are
+    comparable across periods of different length.
+
     Args:
-        portfolio_values: Series of portfolio values over time
+        portfolio_values: Series or array of portfolio values over time
+        lookback_days: Optional trailing window size for the peak
 
     Returns:
         Maximum drawdown as decimal (negative value or zero)
+
+    Raises:
+        ValueError: If lookback_days is not positive
     """
+    if lookback_days is not None and lookback_days <= 0:
+        raise ValueError("Lookback days must be positive")
+
     if len(portfolio_values) < 2:
         return Decimal("0")
 
-    # Calculate running maximum
-    running_max = portfolio_values.expanding().max()
+    values = np.asarray(portfolio_values, dtype=np.float64)
+
+    if lookback_days is None:
+        # Calculate running maximum in a single pass (fmax skips NaN like pandas)
+        running_max = np.fmax.accumulate(values)
+    else:
+        # Trailing-window maximum (pandas uses an O(N) monotonic deque)
+        running_max = (
+            pd.Series(values).rolling(lookback_days, min_periods=1).max().to_numpy()
+        )
 
     # Calculate drawdown at each point
-    drawdown = (portfolio_values - running_max) / running_max
+    drawdown = (values - running_max) / running_max
 
     # Get maximum drawdown (most negative value)
-    max_dd = drawdown.min()
+    max_dd = np.nanmin(drawdown)
 
     result = Decimal(str(max_dd))
 
@@ -42,11 +42,8 @@ class PriceWindow:
 
     def get_complete_assets(self) -> list[str]:
         """Return list of assets with complete (no missing) data."""
-        complete = []
-        for symbol in self.prices.columns:
-            if self.has_complete_data(symbol):
-                complete.append(symbol)
-        return complete
+        complete = self.prices.notna().all()
+        return complete.index[complete].tolist()
 
     def validate(self) -> None:
         """Validate window data structure.
@@ -95,30 +92,29 @@ def get_price_window(
     Raises:
         InsufficientDataError: If fewer than lookback_days available
     """
-    # Filter to dates before calculation_date (convert to pd.Timestamp for comparison)
+    # Filter to required assets before calculation_date (convert to pd.Timestamp
+    # for comparison); the filtered frame is only read, so no copy is needed
     calc_ts = pd.Timestamp(calculation_date)
-    historical_data = prices_df[prices_df["date"] < calc_ts].copy()
-
-    # Filter to required assets
-    asset_data = historical_data[historical_data["symbol"].isin(assets)]
+    asset_data = prices_df[
+        (prices_df["date"] < calc_ts) & prices_df["symbol"].isin(assets)
+    ]
+
+    # Get last N days per asset with a single sort and groupby
+    window_data = (
+        asset_data.sort_values("date", kind="stable")
+        .groupby("symbol", sort=False, observed=True)
+        .tail(lookback_days)
+    )
+    days_available = window_data["symbol"].value_counts()
 
-    # Get last N days per asset
-    window_data_list = []
+    # Check if sufficient data exists
     for asset in assets:
-        asset_prices = asset_data[asset_data["symbol"] == asset].sort_values("date")
-        asset_window = asset_prices.tail(lookback_days)
-
-        # Check if sufficient data exists
-        if len(asset_window) < lookback_days:
+        num_days = int(days_available.get(asset, 0))
+        if num_days < lookback_days:
             raise InsufficientDataError(
-                f"{asset}: only {len(asset_window)} days available, need {lookback_days}"
+                f"{asset}: only {num_days} days available, need {lookback_days}"
             )
 
-        window_data_list.append(asset_window)
-
-    # Combine all assets
-    window_data = pd.concat(window_data_list, ignore_index=True)
-
     # Pivot to get prices by date x symbol
     pivot_data = window_data.pivot(index="date", columns="symbol", values="price")
 
@@ -143,6 +139,12 @@ def get_price_window(
     return price_window
 
 
+def _assets_with_full_window(prices: pd.DataFrame, lookback_days: int) -> list[str]:
+    """Return columns with at least lookback_days non-null prices."""
+    non_null_counts = prices.notna().sum()
+    return non_null_counts.index[non_null_counts >= lookback_days].tolist()
+
+
 def get_price_window_with_fallback(
     prices_df: pd.DataFrame,
     calculation_date: date,
@@ -176,11 +178,7 @@ def get_price_window_with_fallback(
             assets=assets,
         )
         # Filter to assets with complete data (no NaN values)
-        complete_assets = []
-        for symbol in price_window.prices.columns:
-            non_null_count = price_window.prices[symbol].notna().sum()
-            if non_null_count >= lookback_days:
-                complete_assets.append(symbol)
+        complete_assets = _assets_with_full_window(price_window.prices, lookback_days)
 
         excluded_assets = [asset for asset in assets if asset not in complete_assets]
         return price_window, excluded_assets
@@ -198,8 +196,7 @@ def get_price_window_with_fallback(
                 assets=[asset],
             )
             # Check if asset has complete data
-            non_null_count = asset_window.prices[asset].notna().sum()
-            if non_null_count >= lookback_days:
+            if _assets_with_full_window(asset_window.prices, lookback_days):
                 complete_assets.append(asset)
         except InsufficientDataError:
             pass
@@ -7,6 +7,10 @@ import pandas as pd
 from ..models import RebalancingFrequency
 from ..models.portfolio_state import PortfolioState
 
+# Rounding precision for trade quantities
+QUANTITY_PRECISION = Decimal("0.000001")
+ZERO = Decimal("0")
+
 
 def generate_rebalancing_dates(
     start_date: date, end_date: date, frequency: RebalancingFrequency
@@ -82,7 +86,7 @@ def calculate_rebalancing_trades(
     total_value = current_state.total_value
 
     if total_value == 0:
-        return {symbol: Decimal("0") for symbol in target_weights.keys()}
+        return {symbol: ZERO for symbol in target_weights.keys()}
 
     trades = {}
 
@@ -91,7 +95,7 @@ def calculate_rebalancing_trades(
         target_value = total_value * target_weight
 
         # Calculate current value
-        current_quantity = current_state.asset_holdings.get(symbol, Decimal("0"))
+        current_quantity = current_state.asset_holdings.get(symbol, ZERO)
         current_price = current_state.current_prices[symbol]
         current_value = current_quantity * current_price
 
@@ -103,7 +107,7 @@ def calculate_rebalancing_trades(
 
         # Round to 6 decimal places
         quantity_change = quantity_change.quantize(
-            Decimal("0.000001"), rounding=ROUND_HALF_UP
+            QUANTITY_PRECISION, rounding=ROUND_HALF_UP
         )
 
         trades[symbol] = quantity_change
@@ -41,6 +41,8 @@ class CSVDataProvider(HistoricalDataProvider):
             DataError: If files not found or data invalid
         """
         all_data = []
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
 
         for symbol in symbols:
             # Try to find CSV file for this symbol
@@ -59,15 +61,31 @@ class CSVDataProvider(HistoricalDataProvider):
 
             # Load the first matching file
             try:
-                df = pd.read_csv(matching_files[0])
-            except (pd.errors.ParserError, FileNotFoundError, PermissionError) as e:
+                df = pd.read_csv(
+                    matching_files[0],
+                    parse_dates=["date"],
+                    dtype={"symbol": str, "price": "float64", "currency": str},
+                )
+            except (
+                pd.errors.ParserError,
+                FileNotFoundError,
+                PermissionError,
+                ValueError,
+            ) as e:
                 raise DataError(f"Failed to read CSV for {symbol}: {e}") from e
 
-            # Convert date column to datetime
+            # parse_dates falls back to strings on malformed dates; no-op otherwise
             df["date"] = pd.to_datetime(df["date"])
 
-            # Filter by symbol (in case file contains multiple symbols)
-            df = df[df["symbol"] == symbol].copy()
+            # Filter by symbol (in case file contains multiple symbols) and
+            # by date range in a single pass
+            in_range = (
+                (df["symbol"] == symbol)
+                & (df["date"] >= start_ts)
+                & (df["date"] <= end_ts)
+            )
+            # No copy: pd.concat below builds a new frame anyway
+            df = df[in_range]
 
             all_data.append(df)
 
@@ -77,11 +95,8 @@ class CSVDataProvider(HistoricalDataProvider):
 
         combined_df = pd.concat(all_data, ignore_index=True)
 
-        # Filter by date range
-        combined_df = combined_df[
-            (combined_df["date"] >= pd.Timestamp(start_date))
-            & (combined_df["date"] <= pd.Timestamp(end_date))
-        ].copy()
+        # Few distinct symbols repeated over many rows: store as category codes
+        combined_df["symbol"] = combined_df["symbol"].astype("category")
 
         if combined_df.empty:
             raise DataError(f"No data found for date range {start_date} to {end_date}")
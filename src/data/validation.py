@@ -32,11 +32,14 @@ def validate_price_data(df: pd.DataFrame) -> None:
     if duplicates.any():
         raise DataError(f"Duplicate entries found:\n{df[duplicates]}")
 
-    # Verify chronological order within each symbol
-    for symbol in df["symbol"].unique():
-        symbol_data = df[df["symbol"] == symbol].sort_values("date")
-        if not symbol_data["date"].is_monotonic_increasing:
-            raise DataError(f"Dates not chronological for {symbol}")
+    # Verify chronological order within each symbol (one groupby pass
+    # instead of a boolean mask scan per symbol)
+    monotonic = df.groupby("symbol", sort=False, observed=True)[
+        "date"
+    ].is_monotonic_increasing
+    if not monotonic.all():
+        symbol = monotonic[~monotonic].index[0]
+        raise DataError(f"Dates not chronological for {symbol}")
 
 
 def validate_exchange_rate_data(df: pd.DataFrame) -> None:
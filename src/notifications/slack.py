@@ -3,7 +3,10 @@
 import requests
 
 from src.notifications.models import SlackNotification, NotificationStatus
-from src.account.logging import logger
+from src.account.logging import configure_logging, logger
+
+# Shared session so repeated webhook posts reuse pooled connections
+_session = requests.Session()
 
 
 class SlackClient:
@@ -17,6 +20,7 @@ class SlackClient:
             webhook_url: Slack webhook URL
             timeout: Request timeout in seconds
         """
+        configure_logging()
         self.webhook_url = webhook_url
         self.timeout = timeout
 
@@ -31,7 +35,7 @@ class SlackClient:
             bool: True if sent successfully, False otherwise
         """
         try:
-            response = requests.post(
+            response = _session.post(
                 notification.webhook_url,
                 json=notification.message,
                 timeout=self.timeout,
@@ -102,6 +106,8 @@ def send_portfolio_update(
     from src.notifications.formatters import PortfolioFormatter
     from src.notifications.models import NotificationTrigger
 
+    configure_logging()
+
     # Validate webhook URL
     try:
         SlackClient.validate_webhook_url(webhook_url)
@@ -66,10 +66,11 @@ class MomentumStrategy(DynamicAllocationStrategy):
 
         # Filter by minimum momentum threshold if specified
         if self.parameters.min_momentum is not None:
+            min_momentum = float(self.parameters.min_momentum)
             filtered_scores = {
                 asset: score
                 for asset, score in momentum_scores.items()
-                if score >= float(self.parameters.min_momentum)
+                if score >= min_momentum
             }
             # Track assets excluded by min_momentum
             for asset in momentum_scores:
@@ -136,8 +137,8 @@ class MomentumStrategy(DynamicAllocationStrategy):
                 # Skip if insufficient data
                 continue
 
-            start_price = asset_prices.iloc[0]
-            end_price = asset_prices.iloc[-1]
+            start_price = asset_prices.iat[0]
+            end_price = asset_prices.iat[-1]
 
             # Calculate momentum: (end/start) - 1
             if start_price > 0:  # Avoid division by zero
@@ -4,6 +4,7 @@ from datetime import date
 from decimal import Decimal
 import math
 
+import numpy as np
 import pandas as pd
 
 from ..backtesting.price_window import get_price_window_with_fallback
@@ -65,10 +66,9 @@ class RiskParityStrategy(DynamicAllocationStrategy):
         )
 
         # Filter out zero volatility assets
+        min_volatility = float(self.parameters.min_volatility_threshold)
         non_zero_volatilities = {
-            asset: vol
-            for asset, vol in volatilities.items()
-            if vol >= float(self.parameters.min_volatility_threshold)
+            asset: vol for asset, vol in volatilities.items() if vol >= min_volatility
         }
 
         # Track assets excluded by zero volatility
@@ -124,25 +124,26 @@ class RiskParityStrategy(DynamicAllocationStrategy):
             Dictionary mapping asset to annualized volatility
         """
         volatilities = {}
+        annualization = math.sqrt(self.parameters.annualization_factor)
 
         for asset in assets:
-            asset_prices = price_window[asset].dropna()
+            asset_prices = price_window[asset].dropna().to_numpy(dtype=np.float64)
 
             if len(asset_prices) < 2:
                 # Skip if insufficient data
                 continue
 
             # Calculate daily returns
-            returns = asset_prices.pct_change().dropna()
+            returns = np.diff(asset_prices) / asset_prices[:-1]
 
             if len(returns) < 2:
                 continue
 
             # Calculate daily standard deviation (sample std with ddof=1)
-            daily_std = returns.std(ddof=1)
+            daily_std = np.std(returns, ddof=1)
 
             # Annualize: multiply by sqrt(trading days per year)
-            annualized_vol = daily_std * math.sqrt(self.parameters.annualization_factor)
+            annualized_vol = daily_std * annualization
 
             volatilities[asset] = float(annualized_vol)
 
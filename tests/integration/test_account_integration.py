@@ -7,8 +7,8 @@ from datetime import datetime, timedelta, timezone
 class TestEndToEndAuthenticationAndFetch:
     """Test end-to-end authentication and holdings fetch."""
 
-    @patch("requests.post")
-    @patch("requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     def test_authenticate_and_fetch_holdings(self, mock_get, mock_post):
         """Test complete flow: authenticate then fetch holdings."""
         from src.account.auth import authenticate, get_provider
@@ -110,7 +110,7 @@ class TestTokenRefreshOnExpiry:
 class TestRetryOnTransientFailure:
     """Test retry logic for transient failures."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_retry_on_500_error(self, mock_get):
         """Test that 500 errors are retried."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
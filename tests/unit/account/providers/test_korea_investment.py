@@ -10,7 +10,7 @@ import json
 class TestKoreaInvestmentAuthentication:
     """Test KoreaInvestmentProvider.authenticate()."""
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_authenticate_success(self, mock_post):
         """Test successful authentication."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -46,7 +46,7 @@ class TestKoreaInvestmentAuthentication:
         assert result.access_token == "test_token_123"
         assert result.token_expiry is not None
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_authenticate_failure(self, mock_post):
         """Test authentication failure."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -80,7 +80,7 @@ class TestKoreaInvestmentAuthentication:
 class TestKoreaInvestmentFetchHoldings:
     """Test KoreaInvestmentProvider.fetch_holdings()."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_holdings_with_positions(self, mock_get):
         """Test fetching holdings with multiple positions."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -133,7 +133,7 @@ class TestKoreaInvestmentFetchHoldings:
         assert holdings.positions[2].symbol == "AAPL"
         assert holdings.positions[2].name == "Apple Inc"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_holdings_empty(self, mock_get):
         """Test fetching holdings with no positions."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -201,7 +201,7 @@ class TestAPIResponseParsing:
 class TestErrorHandling:
     """Test error handling for network and API errors."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_network_timeout(self, mock_get):
         """Test handling of network timeout."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -231,7 +231,7 @@ class TestErrorHandling:
         with pytest.raises(AccountAPIException):
             provider.fetch_holdings(account, credentials)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_server_error_500(self, mock_get):
         """Test handling of 500 server error."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -267,7 +267,7 @@ class TestErrorHandling:
 class TestRateLimitingIntegration:
     """Test rate limiting integration."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_rate_limiting_enforced(self, mock_get):
         """Test that rate limiting is enforced between requests."""
         from src.account.providers.korea_investment import KoreaInvestmentProvider
@@ -155,3 +155,24 @@ class TestAutoReauthentication:
 
             assert result.access_token == "new_token"
             assert result.token_expiry > datetime.now(timezone.utc)
+
+
+class TestGetProvider:
+    """Test provider instance reuse."""
+
+    def test_provider_reused_per_app_key(self):
+        """Test that providers are shared per app key and separate across keys."""
+        from src.account.auth import get_provider
+
+        with patch.dict("src.account.auth._providers", clear=True):
+            first = get_provider("korea_investment", "key-A")
+            assert get_provider("korea_investment", "key-A") is first
+            assert get_provider("korea_investment", "key-B") is not first
+
+    def test_provider_cache_does_not_hold_plaintext_app_key(self):
+        """Test that the provider cache is keyed by a hash of the app key."""
+        from src.account import auth
+
+        with patch.dict("src.account.auth._providers", clear=True):
+            auth.get_provider("korea_investment", "secret-app-key")
+            assert not any("secret-app-key" in key for key in auth._providers)
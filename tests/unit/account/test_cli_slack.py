@@ -162,3 +162,31 @@ class TestSendToSlack:
             result = send_to_slack(config, [holdings])
 
         assert result == 0
+
+
+class TestGetService:
+    """Test AccountService reuse across CLI invocations."""
+
+    def test_service_replaced_when_encryption_key_changes(self, tmp_path, monkeypatch):
+        """Test a new service is built when ACCOUNT_ENCRYPTION_KEY changes."""
+        from src.account import cli
+
+        config_path = str(tmp_path / "config.yaml")
+        (tmp_path / "config.yaml").write_text("accounts: []\n")
+
+        with (
+            patch.dict(cli._SERVICE_CACHE, clear=True),
+            patch("src.account.service.AccountService") as mock_service,
+        ):
+            mock_service.side_effect = lambda path: Mock()
+
+            monkeypatch.setenv("ACCOUNT_ENCRYPTION_KEY", "key-one")
+            first = cli._get_service(config_path)
+            assert cli._get_service(config_path) is first
+
+            monkeypatch.setenv("ACCOUNT_ENCRYPTION_KEY", "key-two")
+            second = cli._get_service(config_path)
+
+            assert second is not first
+            assert mock_service.call_count == 2
+            assert not any("key-two" in map(str, key) for key in cli._SERVICE_CACHE)
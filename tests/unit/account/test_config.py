@@ -203,3 +203,139 @@ class TestEncryptedCredentialLoading:
                 load_config(config_path)
         finally:
             Path(config_path).unlink()
+
+    def test_load_config_returns_independent_copies(self):
+        """Test that repeated loads reuse the cache without sharing state."""
+        from src.account.config import load_config
+        from src.account.crypto import encrypt, generate_key
+        import os
+
+        key = generate_key()
+        os.environ["ACCOUNT_ENCRYPTION_KEY"] = key
+
+        config_data = {
+            "version": "1.0",
+            "accounts": [
+                {
+                    "name": "Test",
+                    "provider": "korea_investment",
+                    "enabled": True,
+                    "credentials": {
+                        "app_key": encrypt("my_app_key", key),
+                        "app_secret": encrypt("secret", key),
+                        "account_number": encrypt("1234567890", key),
+                    },
+                }
+            ],
+            "notifications": {
+                "slack": {
+                    "enabled": False,
+                    "webhook_url": "",
+                    "triggers": [],
+                    "format": "summary",
+                }
+            },
+            "refresh": {"auto_enabled": False, "interval_minutes": 60},
+        }
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump(config_data, f)
+            config_path = f.name
+
+        try:
+            first = load_config(config_path)
+            first.accounts[0].enabled = False
+
+            second = load_config(config_path)
+            assert second.accounts[0].enabled is True
+            assert second.accounts[0].credentials.app_key == "my_app_key"
+        finally:
+            Path(config_path).unlink()
+            del os.environ["ACCOUNT_ENCRYPTION_KEY"]
+
+    def test_load_config_sidecar_cache_keeps_credentials_encrypted(self):
+        """Test that the opt-in JSON sidecar never stores plaintext secrets."""
+        from src.account import config as config_module
+        from src.account.crypto import encrypt, generate_key
+        import os
+
+        key = generate_key()
+        os.environ["ACCOUNT_ENCRYPTION_KEY"] = key
+        os.environ["ACCOUNT_CONFIG_CACHE"] = "1"
+
+        config_data = {
+            "version": "1.0",
+            "accounts": [
+                {
+                    "name": "Test",
+                    "provider": "korea_investment",
+                    "enabled": True,
+                    "credentials": {
+                        "app_key": encrypt("my_app_key", key),
+                        "app_secret": encrypt("my_app_secret", key),
+                        "account_number": encrypt("1234567890", key),
+                    },
+                }
+            ],
+        }
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump(config_data, f)
+            config_path = f.name
+        sidecar = config_module._sidecar_path(Path(config_path))
+
+        try:
+            config_module.load_config(config_path)
+            assert sidecar.exists()
+            assert sidecar.stat().st_mode & 0o777 == 0o600
+            assert "my_app_secret" not in sidecar.read_text()
+
+            # A fresh process would only have the sidecar to go on
+            config_module._CONFIG_CACHE.clear()
+            config = config_module.load_config(config_path)
+            assert config.accounts[0].credentials.app_secret == "my_app_secret"
+        finally:
+            Path(config_path).unlink()
+            sidecar.unlink(missing_ok=True)
+            del os.environ["ACCOUNT_ENCRYPTION_KEY"]
+            del os.environ["ACCOUNT_CONFIG_CACHE"]
+
+    def test_load_config_sidecar_skipped_for_plaintext_credentials(self):
+        """Test that plaintext credentials are never copied into a sidecar."""
+        from src.account import config as config_module
+        from src.account.crypto import generate_key
+        import os
+
+        os.environ["ACCOUNT_ENCRYPTION_KEY"] = generate_key()
+        os.environ["ACCOUNT_CONFIG_CACHE"] = "1"
+
+        config_data = {
+            "version": "1.0",
+            "accounts": [
+                {
+                    "name": "Test",
+                    "provider": "korea_investment",
+                    "enabled": True,
+                    "credentials": {
+                        "app_key": "plain_app_key",
+                        "app_secret": "plain_app_secret",
+                        "account_number": "1234567890",
+                    },
+                }
+            ],
+        }
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump(config_data, f)
+            config_path = f.name
+        sidecar = config_module._sidecar_path(Path(config_path))
+
+        try:
+            config = config_module.load_config(config_path)
+            assert config.accounts[0].credentials.app_secret == "plain_app_secret"
+            assert not sidecar.exists()
+        finally:
+            Path(config_path).unlink()
+            sidecar.unlink(missing_ok=True)
+            del os.environ["ACCOUNT_ENCRYPTION_KEY"]
+            del os.environ["ACCOUNT_CONFIG_CACHE"]
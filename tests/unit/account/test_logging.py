@@ -0,0 +1,29 @@
+"""Unit tests for account logging setup."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+class TestLoggingImport:
+    """Test that importing account modules has no logging side effects."""
+
+    def test_import_does_not_configure_logging(self, tmp_path):
+        """Test that imports create no logs directory and no listener thread."""
+        repo_root = Path(__file__).resolve().parents[3]
+        script = (
+            "import logging, threading\n"
+            "import src.account.service, src.account.scheduler\n"
+            "import src.notifications.slack\n"
+            "assert not logging.getLogger().handlers\n"
+            "assert threading.active_count() == 1\n"
+        )
+
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env={"PYTHONPATH": str(repo_root)},
+            check=True,
+        )
+
+        assert not (tmp_path / "logs").exists()
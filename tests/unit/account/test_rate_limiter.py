@@ -68,3 +68,20 @@ class TestRateLimiter:
         limiter.wait()
         second_wait = time.time() - start
         assert second_wait >= 0.1
+
+    def test_rate_limiter_burst(self):
+        """Test that burst tokens allow back-to-back operations."""
+        from src.account.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(delay=0.1, burst=2)
+
+        # Two operations fit in the initial bucket
+        start = time.time()
+        limiter.wait()
+        limiter.wait()
+        assert time.time() - start < 0.05
+
+        # Third operation waits for a refill
+        start = time.time()
+        limiter.wait()
+        assert time.time() - start >= 0.09
@@ -120,6 +120,115 @@ class TestAccountServiceGetHoldings:
         assert holdings.cash_balance == Decimal("1000000")
 
 
+class TestAccountServiceGetAllHoldings:
+    """Test AccountService.get_all_holdings()."""
+
+    @patch("src.account.service.TokenCache")
+    @patch("src.account.service.load_config")
+    def test_get_all_holdings_keeps_order_and_skips_failures(
+        self, mock_load_config, mock_token_cache
+    ):
+        """Test concurrent fetch keeps config order and skips failed accounts."""
+        from src.account.service import AccountService
+
+        accounts = []
+        for name, enabled in [("A", True), ("B", True), ("C", False), ("D", True)]:
+            account = Mock()
+            account.name = name
+            account.enabled = enabled
+            accounts.append(account)
+        mock_config = Mock()
+        mock_config.accounts = accounts
+        mock_load_config.return_value = mock_config
+
+        def fake_get_holdings(name):
+            if name == "B":
+                raise ValueError("API down")
+            return f"holdings-{name}"
+
+        service = AccountService("config.yaml")
+        with patch.object(service, "get_holdings", side_effect=fake_get_holdings):
+            all_holdings = service.get_all_holdings()
+
+        assert list(all_holdings) == ["A", "D"]
+        assert all_holdings["D"] == "holdings-D"
+
+    @patch("requests.Session.get")
+    @patch("src.account.service.TokenCache")
+    @patch("src.account.service.load_config")
+    @patch("src.account.service.authenticate")
+    def test_get_all_holdings_fetches_accounts_concurrently(
+        self, mock_auth, mock_load_config, mock_token_cache, mock_get
+    ):
+        """Test that accounts with different app keys are fetched in parallel."""
+        import json
+        import threading
+        from datetime import datetime, timedelta, timezone
+        from src.account import auth
+        from src.account.config import AccountCredentials
+        from src.account.models import AccountStatus, BrokerageAccount
+        from src.account.service import AccountService
+
+        with open("tests/fixtures/mock_korea_investment_responses.json") as f:
+            mock_data = json.load(f)
+
+        accounts = []
+        for name in ["A", "B"]:
+            account = Mock()
+            account.name = name
+            account.enabled = True
+            account.provider = "korea_investment"
+            account.credentials = AccountCredentials(
+                app_key=f"key-{name}",
+                app_secret="secret",
+                account_number="1234567890",
+            )
+            accounts.append(account)
+        mock_config = Mock()
+        mock_config.accounts = accounts
+        mock_load_config.return_value = mock_config
+
+        mock_token_cache.return_value.get.return_value = None
+        mock_auth.side_effect = lambda account, credentials: BrokerageAccount(
+            account_id=account.account_id,
+            provider=account.provider,
+            account_number=account.account_number,
+            status=AccountStatus.CONNECTED,
+            access_token="token",
+            token_expiry=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+
+        # Each account's domestic request waits until the other account's is
+        # also in flight; fetching in sequence breaks the barrier on timeout
+        # and the account is dropped from the results
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def blocking_get(url, **kwargs):
+            if "overseas" not in url:
+                both_in_flight.wait()
+            response = Mock()
+            response.status_code = 200
+            if "overseas" in url:
+                payload = mock_data["overseas_holdings_with_positions"]
+            else:
+                payload = mock_data["holdings_with_positions"]
+            response.json.return_value = payload
+            return response
+
+        mock_get.side_effect = blocking_get
+
+        with patch.dict("src.account.auth._providers", clear=True):
+            service = AccountService("config.yaml")
+            all_holdings = service.get_all_holdings()
+            providers = list(auth._providers.values())
+
+        assert list(all_holdings) == ["A", "B"]
+        assert mock_get.call_count == 4
+        # One provider (rate limiter and session) per app key
+        assert len(providers) == 2
+        assert providers[0] is not providers[1]
+
+
 class TestIncompleteDataHandling:
     """Test handling of incomplete data."""
 
@@ -75,6 +75,23 @@ class TestMetricCalculations:
         # Expected: 0 (no drawdown)
         assert result == Decimal("0")
 
+    def test_max_drawdown_with_lookback(self):
+        """Test max drawdown with trailing peak window."""
+        # Slow decline from a peak of 200: each 2-day window sees a small drop
+        portfolio_values = pd.Series([100, 200, 190, 180, 170, 160])
+
+        full = metrics.calculate_max_drawdown(portfolio_values)
+        windowed = metrics.calculate_max_drawdown(portfolio_values, lookback_days=2)
+
+        # Expected: full = (160 - 200) / 200, windowed = (160 - 170) / 170
+        assert full == Decimal("-0.2000")
+        assert windowed == Decimal("-0.0588")
+
+    def test_max_drawdown_invalid_lookback(self):
+        """Test max drawdown rejects non-positive lookback."""
+        with pytest.raises(ValueError):
+            metrics.calculate_max_drawdown(pd.Series([100, 90]), lookback_days=0)
+
     def test_sharpe_ratio(self):
         """Test Sharpe ratio calculation."""
         annualized_return = Decimal("0.12")  # 12%
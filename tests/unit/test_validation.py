@@ -0,0 +1,41 @@
+"""Unit tests for data validation utilities."""
+
+import pandas as pd
+import pytest
+
+from src.backtesting.exceptions import DataError
+from src.data.validation import validate_price_data
+
+
+def _price_frame(dates, symbols):
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates),
+            "symbol": symbols,
+            "price": [100.0] * len(dates),
+            "currency": ["USD"] * len(dates),
+        }
+    )
+
+
+class TestValidatePriceData:
+    """Test suite for validate_price_data."""
+
+    def test_chronological_dates_pass(self):
+        """Interleaved symbols with ascending dates per symbol are valid."""
+        df = _price_frame(
+            ["2020-01-01", "2020-01-01", "2020-01-02", "2020-01-02"],
+            ["SPY", "AGG", "SPY", "AGG"],
+        )
+
+        validate_price_data(df)
+
+    def test_out_of_order_dates_raise(self):
+        """Dates out of order within a symbol are rejected."""
+        df = _price_frame(
+            ["2020-01-01", "2020-01-03", "2020-01-02", "2020-01-01"],
+            ["SPY", "SPY", "SPY", "AGG"],
+        )
+
+        with pytest.raises(DataError, match="Dates not chronological for SPY"):
+            validate_price_data(df)